@@ -1,8 +1,77 @@
+import hashlib
 import sys
 import os
+import random
+import time
+import traceback
+from functools import lru_cache
 import requests
+from requests.adapters import HTTPAdapter
 from urllib.parse import urlparse
 
+# GitHub API endpoint for registration tokens
+API_URL_TEMPLATE = "https://api.github.com/repos/{owner}/{repo}/actions/runners/registration-token"
+
+# Transient failures (rate limiting, gateway errors) are retried with exponential backoff;
+# auth and not-found errors fail immediately.
+RETRY_STATUS_CODES = {429, 502, 503, 504}
+MAX_RETRIES = 3
+BASE_DELAY = 1.0
+MAX_DELAY = 30.0
+
+# Shared session so retries, the Bearer fallback and repeated calls reuse one pooled
+# TLS connection to api.github.com. Callers fetching tokens in a loop share it too.
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=10, max_retries=0))
+_SESSION.headers.update({"Accept": "application/vnd.github.v3+json"})
+
+# Authorization scheme ("token" or "Bearer") that last worked for each PAT, keyed by a
+# hash of the PAT so the secret itself is not kept as a key.
+_AUTH_SCHEME_CACHE: dict[str, str] = {}
+
+
+def _pat_key(pat: str) -> str:
+    return hashlib.sha256(pat.encode()).hexdigest()[:16]
+
+
+def _retry_delay(response, attempt: int) -> float:
+    """Seconds to wait before the next attempt: Retry-After if given, else jittered exponential backoff."""
+    retry_after = response.headers.get("Retry-After") if response is not None else None
+    if retry_after and retry_after.isdigit():
+        return min(float(retry_after), MAX_DELAY)
+    return min(BASE_DELAY * (2 ** attempt) * (0.5 + random.random()), MAX_DELAY)
+
+
+def _post_with_retry(url: str, headers: dict) -> requests.Response:
+    """
+    POST to the GitHub API, retrying network errors and 429/5xx responses.
+
+    Returns the last response; other status codes are returned as-is for the caller to handle.
+    """
+    for attempt in range(MAX_RETRIES + 1):
+        try:
+            response = _SESSION.post(url, headers=headers, timeout=10)
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
+            if attempt == MAX_RETRIES:
+                raise
+            time.sleep(_retry_delay(None, attempt))
+            continue
+        if response.status_code not in RETRY_STATUS_CODES or attempt == MAX_RETRIES:
+            return response
+        time.sleep(_retry_delay(response, attempt))
+
+
+@lru_cache(maxsize=64)
+def _parse_repo_url(repo_url: str) -> tuple[str, str]:
+    """Return (owner, repo_name) from a repository URL. Memoized per URL."""
+    # Parse repository owner and name from URL
+    path_parts = urlparse(repo_url).path.strip('/').split('/', 2)
+    
+    if len(path_parts) < 2:
+        raise ValueError(f"Invalid repository URL format: {repo_url}. Expected format: https://github.com/owner/repo")
+    
+    return path_parts[0], path_parts[1]
+
 
 def get_registration_token(repo_url: str, pat: str) -> str:
     """
@@ -20,64 +89,45 @@ def get_registration_token(repo_url: str, pat: str) -> str:
         requests.HTTPError: If API request fails (401, 404, etc.)
         Exception: For other errors (network issues, etc.)
     """
-    # Parse repository owner and name from URL
-    parsed = urlparse(repo_url)
-    path_parts = parsed.path.strip('/').split('/')
+    owner, repo_name = _parse_repo_url(repo_url)
+    api_url = API_URL_TEMPLATE.format(owner=owner, repo=repo_name)
     
-    if len(path_parts) < 2:
-        raise ValueError(f"Invalid repository URL format: {repo_url}. Expected format: https://github.com/owner/repo")
-    
-    owner = path_parts[0]
-    repo_name = path_parts[1]
-    
-    # GitHub API endpoint for registration tokens
-    api_url = f"https://api.github.com/repos/{owner}/{repo_name}/actions/runners/registration-token"
-    
-    # Try both token formats (classic PAT uses "token", fine-grained might need "Bearer")
-    headers_token = {
-        "Authorization": f"token {pat}",
-        "Accept": "application/vnd.github.v3+json"
-    }
-    
-    headers_bearer = {
-        "Authorization": f"Bearer {pat}",
-        "Accept": "application/vnd.github.v3+json"
-    }
+    # Try both token formats (classic PAT uses "token", fine-grained might need "Bearer"),
+    # starting with the one that last worked for this PAT. Accept is set on the session.
+    pat_key = _pat_key(pat)
+    schemes = ("Bearer", "token") if _AUTH_SCHEME_CACHE.get(pat_key) == "Bearer" else ("token", "Bearer")
     
     try:
-        # Try with "token" format first (for classic PATs)
-        response = requests.post(api_url, headers=headers_token, timeout=10)
+        scheme = schemes[0]
+        response = _post_with_retry(api_url, {"Authorization": f"{scheme} {pat}"})
         
-        # If 403 with token format, try Bearer format (for fine-grained PATs)
+        # If 403 with the first format, try the other one
         if response.status_code == 403:
-            response = requests.post(api_url, headers=headers_bearer, timeout=10)
-        
-        # Get response details for error messages
-        response_text = response.text
-        try:
-            response_json = response.json()
-            error_message = response_json.get("message", "")
-        except:
-            error_message = response_text[:200] if response_text else ""
+            _AUTH_SCHEME_CACHE.pop(pat_key, None)
+            scheme = schemes[1]
+            response = _post_with_retry(api_url, {"Authorization": f"{scheme} {pat}"})
         
         response.raise_for_status()
         
-        token_data = response.json()
-        registration_token = token_data.get("token")
+        try:
+            registration_token = response.json().get("token")
+        except (ValueError, AttributeError):
+            registration_token = None
         
         if not registration_token:
             raise ValueError("Registration token not found in API response")
         
+        _AUTH_SCHEME_CACHE[pat_key] = scheme
         return registration_token
         
     except requests.exceptions.HTTPError as e:
         response = e.response
-        status_code = response.status_code if response else None
+        # Responses are falsy for 4xx/5xx, so compare against None explicitly
+        status_code = response.status_code if response is not None else None
         try:
-            error_json = response.json() if response else {}
-            error_message = error_json.get("message", response.text[:200] if response else "Unknown error")
-        except:
-            error_message = response.text[:200] if response else "Unknown error"
+            error_message = response.json().get("message", response.text[:200])
+        except (ValueError, AttributeError):
+            error_message = response.text[:200] if response is not None else "Unknown error"
         
         if status_code == 401:
             raise requests.HTTPError(f"Authentication failed: Invalid PAT or insufficient permissions. "
@@ -105,7 +155,7 @@ def get_registration_token(repo_url: str, pat: str) -> str:
             try:
                 error_json = e.response.json()
                 error_message = error_json.get("message", e.response.text[:200])
-            except:
+            except (ValueError, AttributeError):
                 error_message = e.response.text[:200] if e.response.text else str(e)
             status_code = e.response.status_code
             raise Exception(f"GitHub API error: {status_code} - {error_message}. Full error: {error_msg}")
@@ -135,7 +185,7 @@ def main():
             try:
                 error_json = e.response.json()
                 api_message = error_json.get("message", "")
-            except:
+            except (ValueError, AttributeError):
                 api_message = e.response.text[:200] if e.response.text else ""
             status_code = e.response.status_code
             print(f"Error: {error_msg}", file=sys.stderr)
@@ -147,7 +197,6 @@ def main():
         sys.exit(1)
     except Exception as e:
         # Generic exception handler with full error details
-        import traceback
         print(f"Error: {type(e).__name__}: {str(e)}", file=sys.stderr)
         print(f"Traceback: {traceback.format_exc()}", file=sys.stderr)
         sys.exit(1)
@@ -16,8 +16,14 @@ def _default_tag_glossary() -> str:
     return os.getenv("OBSIDIAN_TAG_GLOSSARY", "00. Inbox/00. Tag Glossary.md")
 
 
+def _default_max_skeleton_chars() -> int:
+    return int(os.getenv("OBSIDIAN_MAX_SKELETON_CHARS", "0"))
+
+
 class ContextConfig(BaseModel):
     """Configuration for context loading (system instructions, glossary, etc.)."""
 
     system_instructions_path: str = Field(default_factory=_default_system_instructions)
     tag_glossary_path: str = Field(default_factory=_default_tag_glossary)
+    # Cap on the vault map section of the context; 0 means no cap.
+    max_skeleton_chars: int = Field(default_factory=_default_max_skeleton_chars)
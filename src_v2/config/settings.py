@@ -45,3 +45,28 @@ class Settings(BaseSettings):
         alias="OBSIDIAN_REVIEW_DIR",
         description="Relative path for the Review Queue folder",
     )
+    llm_cache_path: str = Field(
+        default="",
+        alias="OBSIDIAN_LLM_CACHE_PATH",
+        description="Relative path for a SQLite cache of LLM responses (empty disables caching)",
+    )
+    llm_cache_ttl: int = Field(
+        default=0,
+        alias="OBSIDIAN_LLM_CACHE_TTL",
+        description="Seconds before a cached LLM response is refreshed (0 keeps responses indefinitely)",
+    )
+    llm_context_cache_ttl: int = Field(
+        default=0,
+        alias="OBSIDIAN_LLM_CONTEXT_CACHE_TTL",
+        description="Seconds to keep the vault context in a Gemini context cache (0 disables)",
+    )
+    ingest_batch_size: int = Field(
+        default=1,
+        alias="OBSIDIAN_INGEST_BATCH_SIZE",
+        description="Number of capture notes sent to the LLM per request during ingestion",
+    )
+    ingest_workers: int = Field(
+        default=4,
+        alias="OBSIDIAN_INGEST_WORKERS",
+        description="Concurrent LLM requests during ingestion",
+    )
@@ -19,6 +19,16 @@ class VaultRepository(ABC):
         """Persist a note to the given path."""
         ...
 
+    @abstractmethod
+    def create_note(self, path: Path, note: Note) -> Path:
+        """Write a note to a new file at path, or its first free -N variant. Returns the path used."""
+        ...
+
+    @abstractmethod
+    def save_notes(self, notes: dict[Path, Note]) -> None:
+        """Persist a batch of notes, keyed by destination path."""
+        ...
+
     @abstractmethod
     def scan_vault(self) -> list[ValidationResult]:
         """Scan the vault and return validation results for files with quality issues."""
@@ -49,6 +59,11 @@ class VaultRepository(ABC):
         """Return raw file content or None if not found. No frontmatter parsing."""
         ...
 
+    @abstractmethod
+    def read_frontmatter(self, path: Path) -> dict | None:
+        """Return raw frontmatter metadata without loading the body. None if not found or unparseable."""
+        ...
+
     @abstractmethod
     def delete_note(self, path: Path) -> None:
         """Delete the file at path."""
@@ -73,3 +88,28 @@ class LLMProvider(ABC):
     ) -> str:
         """Generate a multi-file proposal. Returns raw LLM response with %%FILE%% markers."""
         ...
+
+    def generate_proposals(
+        self,
+        items: list[tuple[str, str]],
+        context: str,
+        skeleton: str,
+    ) -> list[str]:
+        """
+        Generate proposals for several notes that share the same context and skeleton.
+
+        Providers that can answer several notes in one request override this; the
+        default makes one generate_proposal call per item.
+
+        Args:
+            items: (instructions, body) pairs, one per note.
+            context: Vault context shared by all items.
+            skeleton: Vault skeleton shared by all items.
+
+        Returns:
+            One raw proposal response per item, in the same order.
+        """
+        return [
+            self.generate_proposal(instructions, body, context, skeleton)
+            for instructions, body in items
+        ]
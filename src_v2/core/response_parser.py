@@ -3,6 +3,10 @@
 import re
 from typing import TypedDict
 
+FILE_MARKER_RE = re.compile(r"%%FILE:\s*")
+FILE_PATH_RE = re.compile(r"([^\n%]+?)(?:%%|$)")
+BATCH_ITEM_RE = re.compile(r"^%%BATCH_ITEM:\s*(\d+)\s*%%[ \t]*$", re.MULTILINE)
+
 
 class ParsedFile(TypedDict):
     """A single file block from parsed LLM output."""
@@ -43,28 +47,60 @@ def parse_proposal(text: str) -> ParsedProposal:
         return result
 
     normalized_text = text.replace("%%EXPLANATION%%", "").strip()
-    parts = re.split(r"%%FILE:\s*", normalized_text)
+    # One pass over the markers; each file block is matched in place via pos/endpos
+    # rather than splitting the response into intermediate substrings.
+    markers = list(FILE_MARKER_RE.finditer(normalized_text))
 
-    if len(parts) == 1:
-        result["explanation"] = normalized_text.strip()
+    if not markers:
+        result["explanation"] = normalized_text
         return result
 
-    result["explanation"] = parts[0].strip()
+    result["explanation"] = normalized_text[: markers[0].start()].strip()
 
-    for part in parts[1:]:
-        if not part.strip():
-            continue
+    for i, marker in enumerate(markers):
+        start = marker.end()
+        end = markers[i + 1].start() if i + 1 < len(markers) else len(normalized_text)
 
-        path_match = re.match(r"^([^\n%]+?)(?:%%|$)", part)
+        path_match = FILE_PATH_RE.match(normalized_text, start, end)
         if not path_match:
             continue
 
         path = path_match.group(1).strip()
-        content_start = path_match.end()
-        if path_match.group(0).endswith("%%"):
-            content_start = part.find("%%", path_match.start()) + 2
-        content = part[content_start:].strip()
+        content = normalized_text[path_match.end():end].strip()
+        if not path and not content and normalized_text[start:end].isspace():
+            continue
 
         result["files"].append({"path": path, "content": content})
 
     return result
+
+
+def split_batch_response(text: str, count: int) -> list[str | None]:
+    """
+    Split a batched LLM response into per-item responses.
+
+    Expected format:
+        %%BATCH_ITEM: 1%%
+        ... proposal for item 1 ...
+        %%BATCH_ITEM: 2%%
+        ... proposal for item 2 ...
+
+    Args:
+        text: Raw LLM response text.
+        count: Number of items that were sent in the batch.
+
+    Returns:
+        A list of length count; entries are None for items that are missing
+        or appear more than once in the response.
+    """
+    sections: dict[int, list[str]] = {}
+    markers = list(BATCH_ITEM_RE.finditer(text or ""))
+    for i, marker in enumerate(markers):
+        end = markers[i + 1].start() if i + 1 < len(markers) else len(text)
+        sections.setdefault(int(marker.group(1)), []).append(text[marker.end():end].strip())
+
+    results: list[str | None] = []
+    for number in range(1, count + 1):
+        found = sections.get(number)
+        results.append(found[0] if found and len(found) == 1 and found[0] else None)
+    return results
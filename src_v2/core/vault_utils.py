@@ -1,12 +1,22 @@
 """Shared utility functions for vault operations."""
 
+import os
 import re
+from functools import cache
 from pathlib import Path
-
-import frontmatter
+from typing import TYPE_CHECKING
 
 from src_v2.core.domain.models import Frontmatter, Note
 
+if TYPE_CHECKING:
+    from frontmatter import Post
+    from frontmatter.default_handlers import YAMLHandler
+
+FM_BOUNDARY_RE = re.compile(r"^-{3,}\s*$", re.MULTILINE)
+# Runs that sanitize_filename turns into a single "-": anything other than letters, digits,
+# ".", "(" and ")", so spaces, dashes and underscores collapse along with unsafe characters.
+UNSAFE_FILENAME_RUN_RE = re.compile(r"(?:[^\w.()]|_)+")
+
 
 def sanitize_filename(title: str, max_length: int = 200) -> str:
     """
@@ -21,11 +31,7 @@ def sanitize_filename(title: str, max_length: int = 200) -> str:
     Returns:
         Sanitized filename (without extension).
     """
-    safe_chars = "".join(
-        c if (c.isalnum() or c in " .-_()") else "-" for c in title
-    )
-    safe_chars = re.sub(r"[-_\s]+", "-", safe_chars)
-    safe_chars = safe_chars.strip("-")
+    safe_chars = UNSAFE_FILENAME_RUN_RE.sub("-", title).strip("-")
     if len(safe_chars) > max_length:
         safe_chars = safe_chars[:max_length].rstrip("-")
     if not safe_chars:
@@ -33,30 +39,110 @@ def sanitize_filename(title: str, max_length: int = 200) -> str:
     return safe_chars
 
 
-def get_safe_path(target_path: Path) -> Path:
+def _list_dir_names(directory: Path) -> set[str]:
+    """Return the entry names in a directory, or an empty set if it cannot be listed."""
+    try:
+        with os.scandir(directory) as it:
+            return {entry.name for entry in it}
+    except OSError:
+        return set()
+
+
+def get_safe_path(
+    target_path: Path,
+    reserved: set[Path] | None = None,
+    listings: dict[Path, set[str]] | None = None,
+    next_suffix: dict[Path, int] | None = None,
+) -> Path:
     """
     Return a path that does not exist, appending -1, -2, etc. if needed.
 
+    On a collision the parent directory is listed once and suffixes are probed
+    against that listing, rather than stat-ing each candidate.
+
     Args:
         target_path: Desired file path (can be absolute or relative).
+        reserved: Paths already claimed but not yet written (e.g. earlier files in a batch).
+        listings: Optional cache of directory -> entry names, shared across calls. Missing
+            directories are listed on first use and every probe is answered from memory;
+            the caller keeps it in sync with files it writes or deletes.
+        next_suffix: Optional cache of target path -> next suffix to try, shared across calls.
+            Repeated collisions on one name resume where the last probe stopped instead of
+            rescanning from -1, so allocating K copies costs O(K) rather than O(K^2).
 
     Returns:
-        Path that does not exist.
+        Path that does not exist and is not reserved.
     """
-    if not target_path.exists():
-        return target_path
+    reserved = reserved or set()
+    parent = target_path.parent
+    if listings is None:
+        if not target_path.exists() and target_path not in reserved:
+            return target_path
+        taken = _list_dir_names(parent)
+    else:
+        taken = listings.get(parent)
+        if taken is None:
+            taken = listings[parent] = _list_dir_names(parent)
+        if target_path.name not in taken and target_path not in reserved:
+            return target_path
+    taken = taken | {p.name for p in reserved if p.parent == parent}
 
-    counter = 1
     stem = target_path.stem
     suffix = target_path.suffix
-    parent = target_path.parent
-
-    while True:
-        new_name = f"{stem}-{counter}{suffix}"
-        candidate = parent / new_name
-        if not candidate.exists():
-            return candidate
+    counter = next_suffix.get(target_path, 1) if next_suffix is not None else 1
+    while f"{stem}-{counter}{suffix}" in taken:
         counter += 1
+    if next_suffix is not None:
+        next_suffix[target_path] = counter + 1
+    return parent / f"{stem}-{counter}{suffix}"
+
+
+@cache
+def yaml_handler() -> "YAMLHandler":
+    """
+    Return the shared python-frontmatter YAMLHandler.
+
+    python-frontmatter loads and dumps with libyaml's CSafeLoader/CSafeDumper when PyYAML
+    was built with it. Sharing one handler avoids per-call handler construction and format
+    detection. python-frontmatter and PyYAML are imported on first use.
+    """
+    from frontmatter import YAMLHandler
+
+    return YAMLHandler()
+
+
+def load_post(text: str) -> "Post":
+    """
+    Parse note text with python-frontmatter.
+
+    Notes that open with a '---' fence go straight to the shared YAML handler; anything
+    else falls back to python-frontmatter's format detection.
+    """
+    import frontmatter
+
+    handler = yaml_handler()
+    return frontmatter.loads(text, handler=handler if handler.detect(text) else None)
+
+
+def strip_frontmatter(raw_content: str) -> str:
+    """
+    Return the body of a note without parsing its YAML frontmatter.
+
+    Splits on the '---' fences the same way python-frontmatter does, so the result
+    matches Note.body for a loaded note.
+
+    Args:
+        raw_content: Raw markdown string, with or without frontmatter.
+
+    Returns:
+        Stripped body text.
+    """
+    text = raw_content.strip()
+    if FM_BOUNDARY_RE.match(text):
+        parts = FM_BOUNDARY_RE.split(text, 2)
+        if len(parts) == 3:
+            return parts[2].strip()
+    return text
 
 
 def note_from_raw_content(path: Path, raw_content: str) -> Note:
@@ -72,9 +158,29 @@ def note_from_raw_content(path: Path, raw_content: str) -> Note:
     Returns:
         Note with parsed frontmatter and body.
     """
+    import frontmatter
+
     try:
-        post = frontmatter.loads(raw_content)
+        post = load_post(raw_content)
     except Exception:
         post = frontmatter.Post(raw_content, **{})
     fm = Frontmatter.model_validate(dict(post.metadata))
     return Note(path=path, frontmatter=fm, body=post.content or "")
+
+
+def note_to_raw_content(note: Note) -> str:
+    """
+    Serialize a Note to raw markdown (YAML frontmatter + body).
+
+    Args:
+        note: Note to serialize. All frontmatter fields are written, including None values.
+
+    Returns:
+        Raw markdown string.
+    """
+    metadata = yaml_handler().export(note.frontmatter.model_dump(exclude_none=False))
+    # Same layout as frontmatter.dumps, without building a Post and re-stripping the body.
+    body = note.body.rstrip()
+    if not body:
+        return f"---\n{metadata}\n---"
+    return f"---\n{metadata}\n---\n\n{body}"
@@ -1,6 +1,7 @@
 """Chainlit Copilot entrypoint for synchronous vault co-creation."""
 
 import asyncio
+from functools import cache
 
 import chainlit as cl
 from chainlit.input_widget import Select
@@ -12,6 +13,38 @@ from src_v2.use_cases.chat_service import ChatService
 from src_v2.use_cases.proposal_service import ProposalService
 
 
+# Services are built once per process and shared by all sessions. Each service calls
+# genai.configure(), which drops the SDK's cached client, so building them per message
+# opened a new connection (and TLS handshake) for every request and threw away
+# ChatService's per-area models.
+
+
+@cache
+def _repo() -> ObsidianFileSystemAdapter:
+    return ObsidianFileSystemAdapter(Settings().vault_root)
+
+
+@cache
+def _chat_service() -> ChatService:
+    settings = Settings()
+    return ChatService(
+        _repo(),
+        vault_root=settings.vault_root,
+        api_key=settings.gemini_api_key or None,
+    )
+
+
+@cache
+def _proposal_service() -> ProposalService:
+    settings = Settings()
+    return ProposalService(
+        _repo(),
+        vault_root=settings.vault_root,
+        review_dir=settings.review_dir,
+        api_key=settings.gemini_api_key or None,
+    )
+
+
 @cl.on_chat_start
 async def start() -> None:
     """Scan vault on chat start and populate Vault Area dropdown in Chat Settings."""
@@ -50,13 +83,7 @@ async def on_message(message: cl.Message) -> None:
         ).send()
         return
 
-    settings = Settings()
-    repo = ObsidianFileSystemAdapter(settings.vault_root)
-    service = ChatService(
-        repo,
-        vault_root=settings.vault_root,
-        api_key=settings.gemini_api_key or None,
-    )
+    service = _chat_service()
 
     msg = cl.Message(content="")
     await msg.send()
@@ -104,14 +131,7 @@ async def on_draft_updates(action: cl.Action) -> None:
     except Exception:
         history = []
 
-    settings = Settings()
-    repo = ObsidianFileSystemAdapter(settings.vault_root)
-    service = ProposalService(
-        repo,
-        vault_root=settings.vault_root,
-        review_dir=settings.review_dir,
-        api_key=settings.gemini_api_key or None,
-    )
+    service = _proposal_service()
 
     try:
         result = await asyncio.to_thread(
@@ -1,5 +1,6 @@
 """Helpers for the Chainlit Copilot UI."""
 
+import os
 from pathlib import Path
 
 from src_v2.infrastructure.file_system.adapters import EXCLUDED_DIRS
@@ -7,13 +8,15 @@ from src_v2.infrastructure.file_system.adapters import EXCLUDED_DIRS
 
 def scan_top_level_dirs(vault_root: Path) -> list[str]:
     """Scan vault root for top-level directories, excluding hidden and system dirs."""
-    if not vault_root.exists() or not vault_root.is_dir():
+    try:
+        with os.scandir(vault_root) as it:
+            dirs = [
+                entry.name
+                for entry in it
+                if entry.is_dir()
+                and not entry.name.startswith(".")
+                and entry.name not in EXCLUDED_DIRS
+            ]
+    except OSError:
         return []
-    dirs = [
-        p.name
-        for p in vault_root.iterdir()
-        if p.is_dir()
-        and not p.name.startswith(".")
-        and p.name not in EXCLUDED_DIRS
-    ]
     return sorted(dirs)
@@ -8,7 +8,6 @@ from src_v2.config.context_config import ContextConfig
 from src_v2.config.settings import Settings
 from src_v2.core.domain.models import Frontmatter, Note
 from src_v2.infrastructure.file_system.adapters import ObsidianFileSystemAdapter
-from src_v2.infrastructure.llm.adapters import GeminiAdapter
 from src_v2.use_cases.assistant_service import AssistantService
 from src_v2.use_cases.librarian_service import LibrarianService
 from src_v2.use_cases.maintenance_service import MaintenanceService
@@ -38,6 +37,8 @@ def _cmd_audit(args: argparse.Namespace) -> int:
         print("Error: GEMINI_API_KEY is required for audit command.", file=sys.stderr)
         return 1
         
+    from src_v2.infrastructure.llm.adapters import GeminiAdapter
+
     try:
         llm = GeminiAdapter(api_key=settings.gemini_api_key)
     except ValueError as e:
@@ -49,15 +50,19 @@ def _cmd_audit(args: argparse.Namespace) -> int:
     if not results:
         print("No maintenance candidates found. Vault is clean.")
         return 0
-    print(f"\nTop {len(results)} Maintenance Candidates:\n")
-    print(f"{'Rank':<6} | {'Score':<6} | {'Path':<50} | {'Reasons'}")
-    print("-" * 80)
+    # Build the table in memory and emit it with one write instead of a print per row.
+    lines = [
+        f"\nTop {len(results)} Maintenance Candidates:\n",
+        f"{'Rank':<6} | {'Score':<6} | {'Path':<50} | {'Reasons'}",
+        "-" * 80,
+    ]
     for idx, r in enumerate(results, 1):
         reasons = ", ".join(r.reasons)
         path_str = str(r.path)
         if len(path_str) > 48:
             path_str = path_str[:45] + "..."
-        print(f"{idx:<6} | {r.score:<6} | {path_str:<50} | {reasons}")
+        lines.append(f"{idx:<6} | {r.score:<6} | {path_str:<50} | {reasons}")
+    sys.stdout.write("\n".join(lines) + "\n")
     return 0
 
 
@@ -68,6 +73,8 @@ def _cmd_fix(args: argparse.Namespace) -> int:
         return 1
     path = Path(args.path)
     repo = ObsidianFileSystemAdapter(settings.vault_root)
+    from src_v2.infrastructure.llm.adapters import GeminiAdapter
+
     try:
         llm = GeminiAdapter(api_key=settings.gemini_api_key)
     except ValueError as e:
@@ -94,6 +101,8 @@ def _cmd_blueprint(args: argparse.Namespace) -> int:
         print("Error: GEMINI_API_KEY is required for blueprint command.", file=sys.stderr)
         return 1
     repo = ObsidianFileSystemAdapter(settings.vault_root)
+    from src_v2.infrastructure.llm.adapters import GeminiAdapter
+
     try:
         llm = GeminiAdapter(api_key=settings.gemini_api_key)
     except ValueError as e:
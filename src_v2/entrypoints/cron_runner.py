@@ -2,20 +2,25 @@
 
 import logging
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
 from src_v2.config.context_config import ContextConfig
 from src_v2.config.settings import Settings
-from src_v2.core.domain.models import Frontmatter, Note
+from src_v2.core.domain.models import Frontmatter, Note, ValidationResult
 from src_v2.core.response_parser import parse_proposal
 from src_v2.core.vault_utils import note_from_raw_content
 from src_v2.infrastructure.file_system.adapters import ObsidianFileSystemAdapter
 from src_v2.infrastructure.llm.adapters import GeminiAdapter
+from src_v2.infrastructure.llm.cache import CachedLLMProvider
 from src_v2.use_cases.assistant_service import AssistantService
 from src_v2.use_cases.librarian_service import LibrarianService
 from src_v2.use_cases.maintenance_service import MaintenanceService
 
+MAX_FIXES_PER_RUN = 10
+FIX_WORKERS = 4  # Concurrent LLM fix requests; each call is dominated by network latency
+
 
 def _setup_logging(settings: Settings) -> logging.Logger:
     """Configure logging to vault Logs directory."""
@@ -25,23 +30,45 @@ def _setup_logging(settings: Settings) -> logging.Logger:
 
     logger = logging.getLogger("cron_runner")
     logger.setLevel(getattr(logging, settings.log_level.upper(), logging.INFO))
-    handler = logging.FileHandler(log_file, encoding="utf-8")
+    handler = logging.FileHandler(log_file, encoding="utf-8", delay=True)
     handler.setFormatter(logging.Formatter("%(asctime)s - %(levelname)s - %(message)s"))
     logger.addHandler(handler)
 
     return logger
 
 
+def _generate_fixes(maint: MaintenanceService, paths: list[Path], context: str) -> list[str | Exception]:
+    """Request fix proposals concurrently. Returns one proposal or exception per path, in order."""
+
+    def fix_one(path: Path) -> str | Exception:
+        try:
+            return maint.fix_file(path, context=context)
+        except Exception as e:
+            return e
+
+    with ThreadPoolExecutor(max_workers=FIX_WORKERS) as executor:
+        return list(executor.map(fix_one, paths))
+
+
 def main() -> int:
     settings = Settings()
     logger = _setup_logging(settings)
     repo = ObsidianFileSystemAdapter(settings.vault_root)
         
     try:
-        llm = GeminiAdapter(api_key=settings.gemini_api_key)
+        llm = GeminiAdapter(
+            api_key=settings.gemini_api_key,
+            context_cache_ttl=settings.llm_context_cache_ttl,
+        )
     except ValueError as e:
         print(f"Error: {e}", file=sys.stderr)
         return 1
+    if settings.llm_cache_path:
+        llm = CachedLLMProvider(
+            llm,
+            settings.vault_root / settings.llm_cache_path,
+            max_age=settings.llm_cache_ttl,
+        )
 
     task1_ok = False
     task2_ok = False
@@ -71,10 +98,29 @@ def main() -> int:
             logger.info("No offenders to fix")
             task2_ok = True
         else:
-            offenders = results[:10]
-            for i, r in enumerate(offenders, 1):
+            # Drop offenders that vanished since the audit before paying for LLM calls,
+            # so the fix budget goes to notes that still exist. A stat is enough here;
+            # loading each note would read and parse files only to test existence.
+            offenders: list[ValidationResult] = []
+            missing: list[str] = []
+            for r in results:
+                if not (settings.vault_root / r.path).is_file():
+                    missing.append(str(r.path))
+                    continue
+                offenders.append(r)
+                if len(offenders) == MAX_FIXES_PER_RUN:
+                    break
+            if missing:
+                logger.warning("Skipping %d offender(s) no longer on disk: %s", len(missing), ", ".join(missing))
+            # The vault context is built once for the run rather than once per offender.
+            # LLM calls overlap; applying the fixes stays sequential and in audit order.
+            context = assistant.get_full_context() if offenders else ""
+            proposals = _generate_fixes(maint, [r.path for r in offenders], context)
+            for i, (r, proposal) in enumerate(zip(offenders, proposals), 1):
+                if isinstance(proposal, Exception):
+                    logger.error("Fix failed for %s: %s", r.path, proposal, exc_info=proposal)
+                    continue
                 try:
-                    proposal = maint.fix_file(r.path)
                     parsed = parse_proposal(proposal)
                     if not parsed["files"]:
                         logger.warning("No %%FILE%% blocks in fix for %s", r.path)
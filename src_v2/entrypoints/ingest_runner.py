@@ -7,7 +7,7 @@ from pathlib import Path
 
 from src_v2.config.settings import Settings
 from src_v2.infrastructure.file_system.adapters import ObsidianFileSystemAdapter
-from src_v2.infrastructure.llm.adapters import GeminiAdapter
+from src_v2.infrastructure.llm.cache import CachedLLMProvider
 from src_v2.use_cases.filer_service import FilerService
 from src_v2.use_cases.ingestion_service import IngestionService
 
@@ -22,7 +22,7 @@ def _setup_logging(settings: Settings) -> logging.Logger:
     logger.setLevel(getattr(logging, settings.log_level.upper(), logging.INFO))
     formatter = logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
 
-    file_handler = logging.FileHandler(log_file, encoding="utf-8")
+    file_handler = logging.FileHandler(log_file, encoding="utf-8", delay=True)
     file_handler.setFormatter(formatter)
     logger.addHandler(file_handler)
 
@@ -37,10 +37,9 @@ def main() -> int:
     settings = Settings()
     logger = _setup_logging(settings)
 
-    try:
-        llm = GeminiAdapter(api_key=settings.gemini_api_key)
-    except ValueError as e:
-        logger.error("LLM init failed: %s", e)
+    # Settings already falls back to the GEMINI_API_KEY environment variable.
+    if not settings.gemini_api_key:
+        logger.error("LLM init failed: GEMINI_API_KEY not set")
         return 1
 
     repo = ObsidianFileSystemAdapter(settings.vault_root)
@@ -54,12 +53,36 @@ def main() -> int:
         filed_count = filer.file_approved_notes()
         logger.info("Filed %d note(s) from Review Queue", filed_count)
 
+        # Most scheduled runs find nothing to ingest; skip loading the Gemini SDK for them.
+        if not repo.list_note_paths_in(Path(settings.capture_dir)):
+            logger.info("Ingested 0 note(s) from Capture")
+            return 0
+
+        from src_v2.infrastructure.llm.adapters import GeminiAdapter
+
+        try:
+            llm = GeminiAdapter(
+                api_key=settings.gemini_api_key,
+                context_cache_ttl=settings.llm_context_cache_ttl,
+            )
+        except ValueError as e:
+            logger.error("LLM init failed: %s", e)
+            return 1
+        if settings.llm_cache_path:
+            llm = CachedLLMProvider(
+                llm,
+                settings.vault_root / settings.llm_cache_path,
+                max_age=settings.llm_cache_ttl,
+            )
+
         ingestion = IngestionService(
             repo,
             llm,
             capture_dir=settings.capture_dir,
             review_dir=settings.review_dir,
             vault_root=settings.vault_root,
+            batch_size=settings.ingest_batch_size,
+            workers=settings.ingest_workers,
         )
         result = ingestion.run()
         logger.info("Ingested %d note(s) from Capture", result.processed_count)
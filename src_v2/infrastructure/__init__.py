@@ -1,7 +1,21 @@
 """Infrastructure adapters (file system, LLM)."""
 
-from src_v2.infrastructure.file_system.adapters import ObsidianFileSystemAdapter
-from src_v2.infrastructure.llm.adapters import GeminiAdapter
-from src_v2.infrastructure.testing.adapters import FakeLLM, MockVaultAdapter
+from importlib import import_module
 
-__all__ = ["ObsidianFileSystemAdapter", "FakeLLM", "GeminiAdapter", "MockVaultAdapter"]
+# Exports are imported on first access (PEP 562) so that using one adapter does not
+# pull in the others; the Gemini SDK alone takes ~0.5s to import.
+_EXPORTS = {
+    "ObsidianFileSystemAdapter": "src_v2.infrastructure.file_system.adapters",
+    "CachedLLMProvider": "src_v2.infrastructure.llm.cache",
+    "FakeLLM": "src_v2.infrastructure.testing.adapters",
+    "GeminiAdapter": "src_v2.infrastructure.llm.adapters",
+    "MockVaultAdapter": "src_v2.infrastructure.testing.adapters",
+}
+
+__all__ = ["ObsidianFileSystemAdapter", "CachedLLMProvider", "FakeLLM", "GeminiAdapter", "MockVaultAdapter"]
+
+
+def __getattr__(name: str):
+    if name in _EXPORTS:
+        return getattr(import_module(_EXPORTS[name]), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
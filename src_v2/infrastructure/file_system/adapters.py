@@ -1,12 +1,15 @@
 """File system adapters for vault storage."""
 
 import os
+import re
+import threading
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-import frontmatter
-
 from src_v2.core.domain.models import CodeRegistryEntry, Frontmatter, Note, ValidationResult
 from src_v2.core.interfaces.ports import VaultRepository
+from src_v2.core.vault_utils import get_safe_path, load_post, note_to_raw_content, yaml_handler
 
 EXCLUDED_DIRS = frozenset({
     "99. System",
@@ -18,6 +21,14 @@ EXCLUDED_DIRS = frozenset({
 
 BAD_TITLES = frozenset({"untitled", "meeting", "note", "call"})
 
+FENCE_BYTES_RE = re.compile(rb"-{3,}\s*")
+FENCE_SCAN_CHUNK = 8192
+FILE_READ_CHUNK = 65536
+
+SCAN_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+PARALLEL_SCAN_THRESHOLD = 64  # Below this, thread pool startup outweighs the overlap
+PARALLEL_WRITE_THRESHOLD = 8
+
 
 def _normalize_to_list(value: str | list | None) -> list[str]:
     """Normalize aliases/tags to list[str]."""
@@ -48,13 +59,124 @@ def _metadata_to_frontmatter(metadata: dict) -> Frontmatter:
     )
 
 
-def _is_excluded(path: Path, vault_root: Path) -> bool:
-    """Check if path is in an excluded directory."""
+def _read_file_text(file_path: str | Path) -> str:
+    """
+    Read a whole file as UTF-8 (no newline translation) with os.read sized from fstat.
+
+    Notes are small, so this is usually a single read and skips the buffered text-IO stack.
+    """
+    fd = os.open(file_path, os.O_RDONLY)
     try:
-        rel_path = path.relative_to(vault_root)
-        return any(excluded in rel_path.parts for excluded in EXCLUDED_DIRS)
-    except ValueError:
+        size = os.fstat(fd).st_size
+        data = os.read(fd, size + 1)
+        if len(data) != size:  # Short read, or the file changed since fstat
+            chunks = [data]
+            while chunk := os.read(fd, FILE_READ_CHUNK):
+                chunks.append(chunk)
+            data = b"".join(chunks)
+    finally:
+        os.close(fd)
+    return data.decode("utf-8")
+
+
+def _read_frontmatter_block(file_path: str | Path) -> str | None:
+    """
+    Return the raw YAML between the opening and closing '---' fences, or None if absent.
+
+    Scans the raw bytes with bytes.find in fixed-size chunks and stops at the closing
+    fence, so note bodies are never read or decoded. The file is opened unbuffered since
+    each chunk is already a full-size read; only an empty read is treated as end of file.
+    """
+    with open(file_path, "rb", buffering=0) as f:
+        data = bytearray(f.read(FENCE_SCAN_CHUNK))
+        eof = not data
+
+        def read_more() -> bool:
+            nonlocal eof
+            if eof:
+                return False
+            chunk = f.read(FENCE_SCAN_CHUNK)
+            data.extend(chunk)
+            eof = not chunk
+            return not eof
+
+        # Opening fence: first non-blank line, leading whitespace allowed.
+        while True:
+            start = len(data) - len(data.lstrip())
+            end = data.find(b"\n", start)
+            if end != -1 or not read_more():
+                break
+        if end == -1 or not FENCE_BYTES_RE.fullmatch(data, start, end):
+            return None
+
+        # Closing fence: the next line that is only dashes.
+        block_start = pos = end
+        while True:
+            fence = data.find(b"\n---", pos)
+            if fence == -1:
+                pos = max(pos, len(data) - 3)
+                if not read_more():
+                    return None
+                continue
+            line_end = data.find(b"\n", fence + 1)
+            if line_end == -1:
+                if read_more():
+                    continue
+                line_end = len(data)
+            if FENCE_BYTES_RE.fullmatch(data, fence + 1, line_end):
+                return data[block_start + 1 : fence + 1].decode("utf-8")
+            pos = fence + 1
+
+
+def _load_metadata(file_path: str | Path) -> dict | None:
+    """Parse frontmatter metadata from a file. Returns None if it cannot be parsed."""
+    try:
+        block = _read_frontmatter_block(file_path)
+        if block is None:
+            return {}
+        metadata = yaml_handler().load(block)
+    except Exception:
+        return None
+    return metadata if isinstance(metadata, dict) else {}
+
+
+def _load_all_metadata(paths: list[str]) -> list[dict | None]:
+    """Parse frontmatter for each path, in order. Uses a thread pool for large batches."""
+    if len(paths) < PARALLEL_SCAN_THRESHOLD:
+        return [_load_metadata(p) for p in paths]
+    with ThreadPoolExecutor(max_workers=SCAN_WORKERS) as executor:
+        return list(executor.map(_load_metadata, paths))
+
+
+def _walk_markdown_files(root: str) -> Iterator[os.DirEntry]:
+    """
+    Yield directory entries of .md files under root using os.scandir.
+
+    Excluded directories are pruned during the walk; symlinked directories are not followed.
+    """
+    stack = [root]
+    while stack:
+        directory = stack.pop()
+        try:
+            it = os.scandir(directory)
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in EXCLUDED_DIRS:
+                        stack.append(entry.path)
+                elif entry.name.endswith(".md"):
+                    yield entry
+
+
+def _is_excluded_folder(folder_name: str) -> bool:
+    """Check if a vault-relative folder name is absolute or passes through an excluded directory."""
+    if os.path.isabs(folder_name):
         return True
+    if os.altsep:
+        folder_name = folder_name.replace(os.altsep, os.sep)
+    return not EXCLUDED_DIRS.isdisjoint(folder_name.split(os.sep))
 
 
 class ObsidianFileSystemAdapter(VaultRepository):
@@ -69,10 +191,22 @@ class ObsidianFileSystemAdapter(VaultRepository):
         resources_folder: str | None = None,
     ) -> None:
         self.vault_root = Path(vault_root)
+        # Hot loops slice this prefix off walked str paths instead of building Path objects.
+        self._root_prefix = os.path.join(str(self.vault_root), "")
         self.projects_folder = projects_folder or os.getenv("OBSIDIAN_PROJECTS_FOLDER", "20. Projects")
         self.areas_folder = areas_folder or os.getenv("OBSIDIAN_AREAS_FOLDER", "30. Areas")
         self.resources_folder = resources_folder or os.getenv("OBSIDIAN_RESOURCES_FOLDER", "40. Resources")
         self._registry: dict[str, str] = {}
+        # Folder -> expected code, valid for the registry dict it was computed from.
+        self._expected_codes: tuple[dict[str, str], dict[str, str | None]] = (self._registry, {})
+        self._note_cache: dict[str, tuple[tuple[int, int], Note]] = {}
+        self._metadata_cache: dict[str, tuple[tuple[int, int], dict | None]] = {}
+        self._code_index: tuple[dict[str, tuple[int, int]], list[CodeRegistryEntry], dict[str, str]] | None = None
+        self._skeleton: tuple[dict[str, tuple[int, int]], str] | None = None
+        self._known_dirs: set[Path] = set()  # Directories ensured by save_note, to skip repeat mkdirs
+        # Guards the metadata cache and the memoized code index/skeleton; the adapter is shared
+        # by worker threads (cron fixes, chainlit sessions). Reentrant: the builders nest.
+        self._cache_lock = threading.RLock()
 
     def _resolve_path(self, path: Path) -> Path:
         """Resolve path relative to vault_root if not absolute."""
@@ -81,161 +215,302 @@ class ObsidianFileSystemAdapter(VaultRepository):
             return self.vault_root / p
         return p
 
-    def _build_registry(self) -> dict[str, str]:
-        """Build folder -> code mapping from Areas and Projects."""
-        registry: dict[str, str] = {}
-        for folder_name in (self.areas_folder, self.projects_folder):
-            scan_path = self.vault_root / folder_name
-            if not scan_path.exists():
+    def _iter_markdown_files(self, *folder_names: str) -> Iterator[os.DirEntry]:
+        """Yield .md directory entries under the given top-level folders, skipping excluded ones."""
+        for folder_name in folder_names:
+            if _is_excluded_folder(folder_name):
                 continue
-            for file_path in scan_path.rglob("*.md"):
-                if _is_excluded(file_path, self.vault_root):
-                    continue
+            yield from _walk_markdown_files(self._root_prefix + folder_name)
+
+    def _stat_markdown_files(self, *folder_names: str) -> dict[str, tuple[int, int]]:
+        """Return {path: (mtime_ns, size)} for .md files under the given folders, in walk order."""
+        stamps: dict[str, tuple[int, int]] = {}
+        for entry in self._iter_markdown_files(*folder_names):
+            try:
+                st = entry.stat()
+            except OSError:
+                continue
+            stamps[entry.path] = (st.st_mtime_ns, st.st_size)
+        return stamps
+
+    def _cached_metadata(self, stamps: dict[str, tuple[int, int]], *folder_names: str) -> list[dict | None]:
+        """
+        Return frontmatter metadata for the stamped notes, in order.
+
+        Metadata is cached per file and re-parsed only when its (mtime, size) stamp changes.
+        Changed files are parsed on a thread pool for large vaults since each is independent I/O.
+        Cached files under folder_names that are no longer present are evicted.
+        """
+        cache = self._metadata_cache
+        with self._cache_lock:
+            stale = [p for p, stamp in stamps.items() if p not in cache or cache[p][0] != stamp]
+            for path, metadata in zip(stale, _load_all_metadata(stale)):
+                cache[path] = (stamps[path], metadata)
+            roots = tuple(os.path.join(self._root_prefix + f, "") for f in folder_names)
+            for path in [p for p in cache if p.startswith(roots) and p not in stamps]:
+                del cache[path]
+            return [cache[p][1] for p in stamps]
+
+    def _scan_code_files(self, stamps: dict[str, tuple[int, int]]) -> list[tuple[str, dict]]:
+        """Return (file_path, metadata) for the stamped Areas and Projects notes that declare a code."""
+        all_metadata = self._cached_metadata(stamps, self.areas_folder, self.projects_folder)
+        return [
+            (path, metadata)
+            for path, metadata in zip(stamps, all_metadata)
+            if metadata and metadata.get("code")
+        ]
+
+    def _get_code_index(
+        self, stamps: dict[str, tuple[int, int]] | None = None
+    ) -> tuple[list[CodeRegistryEntry], dict[str, str]]:
+        """
+        Return (registry entries, folder -> code mapping) built from one scan of Areas and Projects.
+
+        Areas are walked before Projects, so registry entries list Areas first.
+
+        Memoized on the (mtime, size) stamps of the scanned notes, so repeat calls cost a
+        directory walk and stats rather than reads, and edits made outside this adapter are seen.
+        Callers that already walked Areas and Projects can pass their stamps to skip the walk.
+        """
+        if stamps is None:
+            stamps = self._stat_markdown_files(self.areas_folder, self.projects_folder)
+        with self._cache_lock:
+            if self._code_index is not None and self._code_index[0] == stamps:
+                return self._code_index[1], self._code_index[2]
+            entries: list[CodeRegistryEntry] = []
+            registry: dict[str, str] = {}
+            prefix_len = len(self._root_prefix)
+            for path, metadata in self._scan_code_files(stamps):
+                folder, filename = os.path.split(path[prefix_len:])
+                registry[folder] = metadata["code"]
                 try:
-                    post = frontmatter.load(file_path)
-                    code = post.metadata.get("code")
-                    if not code:
-                        continue
-                    folder = str(file_path.relative_to(self.vault_root).parent)
-                    registry[folder] = code
+                    entries.append(
+                        CodeRegistryEntry(
+                            code=metadata["code"],
+                            name=filename[:-3],
+                            type=metadata.get("type", ""),
+                            folder=folder,
+                        )
+                    )
                 except Exception:
                     continue
-        return registry
+            self._code_index = (stamps, entries, registry)
+            return entries, registry
+
+    def _build_registry(self) -> dict[str, str]:
+        """Build folder -> code mapping from Areas and Projects."""
+        return self._get_code_index()[1]
 
     def _find_expected_code(self, folder_path: str) -> str | None:
-        """Find expected project code for a folder by walking up the tree."""
-        path_parts = Path(folder_path).parts
-        for i in range(len(path_parts), 0, -1):
-            check_path = str(Path(*path_parts[:i]))
-            if check_path in self._registry:
-                return self._registry[check_path]
-        return None
+        """
+        Find expected project code for a folder by walking up the tree.
+
+        Answers are memoized per folder until the registry changes, so sibling notes
+        share one walk.
+        """
+        registry, expected_codes = self._expected_codes
+        if registry is not self._registry:
+            registry, expected_codes = self._registry, {}
+            self._expected_codes = (registry, expected_codes)
+        if folder_path in expected_codes:
+            return expected_codes[folder_path]
+        code = None
+        check_path = folder_path
+        while check_path and check_path != ".":
+            if check_path in registry:
+                code = registry[check_path]
+                break
+            parent = os.path.dirname(check_path)
+            if parent == check_path:
+                break
+            check_path = parent
+        expected_codes[folder_path] = code
+        return code
 
     def _validate_note(self, note: Note) -> ValidationResult | None:
         """
         Evaluate validation rules on a note. Returns ValidationResult if issues found, else None.
         Keeps rule evaluation distinct from file walking.
         """
+        return self._validate(note.path, bool(note.frontmatter.aliases or note.frontmatter.tags))
+
+    def _validate(self, path: Path, has_aliases_or_tags: bool) -> ValidationResult | None:
+        """Apply the validation rules to a note's path and frontmatter summary."""
         score = 0
         reasons: list[str] = []
 
         # Rule 1: Missing Frontmatter (+10)
-        if not note.frontmatter.aliases and not note.frontmatter.tags:
+        if not has_aliases_or_tags:
             score += 10
             reasons.append("Missing aliases/tags")
 
         # Rule 2: Code Mismatch (+50)
-        folder_path = str(note.path.parent)
+        folder_path = str(path.parent)
         expected_code = self._find_expected_code(folder_path)
         if expected_code:
-            stem = note.path.stem
+            stem = path.stem
             if not stem.startswith(expected_code):
                 score += 50
                 reasons.append(f"Missing Project Code: {expected_code}")
 
         # Rule 3: Bad Title (+20)
-        if note.path.stem.lower() in BAD_TITLES:
+        if path.stem.lower() in BAD_TITLES:
             score += 20
             reasons.append("Generic Filename")
 
         if score == 0:
             return None
-        return ValidationResult(path=note.path, score=score, reasons=reasons)
+        return ValidationResult(path=path, score=score, reasons=reasons)
 
-    def get_note(self, path: Path) -> Note | None:
-        """Retrieve a note by path. Returns None if not found."""
-        full_path = self._resolve_path(path)
-        if not full_path.exists():
-            return None
+    def _load_note(self, full_path: str, stamp: tuple[int, int] | None = None) -> Note | None:
+        """
+        Load a note from a resolved str path. Unchanged files (same mtime and size) come from the cache.
+
+        Pass the (mtime_ns, size) stamp when the caller has already stat-ed the file.
+        """
+        if stamp is None:
+            try:
+                st = os.stat(full_path)
+            except OSError:
+                return None
+            stamp = (st.st_mtime_ns, st.st_size)
+        cached = self._note_cache.get(full_path)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
         try:
-            post = frontmatter.load(full_path)
+            post = load_post(_read_file_text(full_path))
         except Exception:
             return None
         fm = _metadata_to_frontmatter(dict(post.metadata))
-        rel_path = full_path.relative_to(self.vault_root)
-        return Note(path=rel_path, frontmatter=fm, body=post.content or "")
+        if full_path.startswith(self._root_prefix):
+            rel_path = Path(full_path[len(self._root_prefix):])
+        else:
+            rel_path = Path(full_path).relative_to(self.vault_root)
+        note = Note(path=rel_path, frontmatter=fm, body=post.content or "")
+        self._note_cache[full_path] = (stamp, note)
+        return note
+
+    def get_note(self, path: Path) -> Note | None:
+        """Retrieve a note by path. Returns None if not found."""
+        return self._load_note(str(self._resolve_path(path)))
+
+    def _write_text(self, full_path: Path, content: str, mode: str = "w") -> None:
+        """Write content to full_path, creating its directory if needed, and drop cached state for it."""
+        parent = full_path.parent
+        if parent not in self._known_dirs:
+            parent.mkdir(parents=True, exist_ok=True)
+            self._known_dirs.add(parent)
+        try:
+            with open(full_path, mode, encoding="utf-8") as f:
+                f.write(content)
+        except FileNotFoundError:
+            # Directory was removed after we first created or saw it.
+            parent.mkdir(parents=True, exist_ok=True)
+            with open(full_path, mode, encoding="utf-8") as f:
+                f.write(content)
+        self._invalidate(full_path)
+
+    def _invalidate(self, full_path: Path) -> None:
+        """Drop cached state for a file that was written or deleted."""
+        with self._cache_lock:
+            self._note_cache.pop(str(full_path), None)
+            self._metadata_cache.pop(str(full_path), None)
+            self._code_index = None
+            self._skeleton = None
 
     def save_note(self, path: Path, note: Note) -> None:
         """Persist a note to the given path."""
+        self._write_text(self._resolve_path(path), note_to_raw_content(note))
+
+    def create_note(self, path: Path, note: Note) -> Path:
+        """
+        Write a note to a new file at path, or at its first free -N variant.
+
+        The file is opened in exclusive-create mode (O_CREAT | O_EXCL), so a name taken by
+        another writer between choosing it and writing is detected rather than overwritten.
+
+        Args:
+            path: Desired path (relative to vault root or absolute).
+            note: Note to write.
+
+        Returns:
+            The path written, relative to vault root when path was relative.
+        """
         full_path = self._resolve_path(path)
-        full_path.parent.mkdir(parents=True, exist_ok=True)
-        metadata = note.frontmatter.model_dump(exclude_none=False)
-        post = frontmatter.Post(note.body, **metadata)
-        content = frontmatter.dumps(post)
-        full_path.write_text(content, encoding="utf-8")
+        content = note_to_raw_content(note)
+        candidate = get_safe_path(full_path)
+        while True:
+            try:
+                self._write_text(candidate, content, mode="x")
+                break
+            except FileExistsError:
+                candidate = get_safe_path(full_path)
+        return candidate if Path(path).is_absolute() else candidate.relative_to(self.vault_root)
+
+    def save_notes(self, notes: dict[Path, Note]) -> None:
+        """Persist a batch of notes, keyed by destination path. Large batches are written concurrently."""
+        if len(notes) < PARALLEL_WRITE_THRESHOLD:
+            for path, note in notes.items():
+                self.save_note(path, note)
+            return
+        with ThreadPoolExecutor(max_workers=SCAN_WORKERS) as executor:
+            list(executor.map(self.save_note, notes.keys(), notes.values()))
 
     def scan_vault(self) -> list[ValidationResult]:
         """Scan the vault and return validation results for files with quality issues."""
-        self._registry = self._build_registry()
+        # One walk of Areas and Projects (the registry's order) feeds both the code index and the note loop.
+        stamps = self._stat_markdown_files(self.areas_folder, self.projects_folder)
+        self._registry = self._get_code_index(stamps)[1]
+        # The rules only look at paths and aliases/tags, so only frontmatter blocks are parsed;
+        # the metadata cache is the one the code index was just built from.
+        all_metadata = self._cached_metadata(stamps, self.areas_folder, self.projects_folder)
+        notes = list(zip(stamps, all_metadata))
+        # Results list Projects before Areas.
+        projects_root = os.path.join(self._root_prefix + self.projects_folder, "")
+        notes.sort(key=lambda item: not item[0].startswith(projects_root))
+        prefix_len = len(self._root_prefix)
         results: list[ValidationResult] = []
-        dirs_to_scan = [
-            self.vault_root / self.projects_folder,
-            self.vault_root / self.areas_folder,
-        ]
-        for root_dir in dirs_to_scan:
-            if not root_dir.exists():
+        for path, metadata in notes:
+            if metadata is None:
                 continue
-            for file_path in root_dir.rglob("*.md"):
-                if _is_excluded(file_path, self.vault_root):
-                    continue
-                note = self.get_note(file_path.relative_to(self.vault_root))
-                if note is None:
-                    continue
-                validation = self._validate_note(note)
-                if validation is not None:
-                    results.append(validation)
+            has_aliases_or_tags = bool(
+                _normalize_to_list(metadata.get("aliases")) or _normalize_to_list(metadata.get("tags"))
+            )
+            validation = self._validate(Path(path[prefix_len:]), has_aliases_or_tags)
+            if validation is not None:
+                results.append(validation)
         return results
 
     def get_code_registry_entries(self) -> list[CodeRegistryEntry]:
         """Return code registry entries from Areas and Projects (files with code in frontmatter)."""
-        entries: list[CodeRegistryEntry] = []
-        for folder_name in (self.areas_folder, self.projects_folder):
-            scan_path = self.vault_root / folder_name
-            if not scan_path.exists():
-                continue
-            for file_path in scan_path.rglob("*.md"):
-                if _is_excluded(file_path, self.vault_root):
-                    continue
-                try:
-                    post = frontmatter.load(file_path)
-                    code = post.metadata.get("code")
-                    if not code:
-                        continue
-                    folder = str(file_path.relative_to(self.vault_root).parent)
-                    entries.append(
-                        CodeRegistryEntry(
-                            code=code,
-                            name=file_path.stem,
-                            type=post.metadata.get("type", ""),
-                            folder=folder,
-                        )
-                    )
-                except Exception:
-                    continue
-        return entries
+        return list(self._get_code_index()[0])
 
     def get_skeleton(self) -> str:
-        """Return vault skeleton (valid link targets) for deep linking."""
-        skeleton: list[str] = []
-        for folder_name in (self.areas_folder, self.projects_folder, self.resources_folder):
-            scan_path = self.vault_root / folder_name
-            if not scan_path.exists():
-                continue
-            for file_path in scan_path.rglob("*.md"):
-                if _is_excluded(file_path, self.vault_root):
-                    continue
-                try:
-                    post = frontmatter.load(file_path)
-                    title = post.metadata.get("title", file_path.stem)
-                    aliases = _normalize_to_list(post.metadata.get("aliases"))
-                    rel_path = file_path.relative_to(self.vault_root)
-                    entry = f"- [[{title}]] ({rel_path})"
-                    if aliases:
-                        entry += f" [Aliases: {', '.join(aliases)}]"
-                    skeleton.append(entry)
-                except Exception:
+        """
+        Return vault skeleton (valid link targets) for deep linking.
+
+        Memoized on the (mtime, size) stamps of the listed notes; only changed notes are re-parsed.
+        """
+        folders = (self.areas_folder, self.projects_folder, self.resources_folder)
+        stamps = self._stat_markdown_files(*folders)
+        with self._cache_lock:
+            if self._skeleton is not None and self._skeleton[0] == stamps:
+                return self._skeleton[1]
+            skeleton: list[str] = []
+            prefix_len = len(self._root_prefix)
+            for path, metadata in zip(stamps, self._cached_metadata(stamps, *folders)):
+                if metadata is None:
                     continue
-        return "\n".join(skeleton)
+                rel_path = path[prefix_len:]
+                title = metadata.get("title", os.path.basename(rel_path)[:-3])
+                aliases = _normalize_to_list(metadata.get("aliases"))
+                if aliases:
+                    skeleton.append(f"- [[{title}]] ({rel_path}) [Aliases: {', '.join(aliases)}]")
+                else:
+                    skeleton.append(f"- [[{title}]] ({rel_path})")
+            result = "\n".join(skeleton)
+            self._skeleton = (stamps, result)
+            return result
 
     def validate_note(self, path: Path) -> ValidationResult | None:
         """Validate a single note. Returns ValidationResult if issues found, else None."""
@@ -248,25 +523,32 @@ class ObsidianFileSystemAdapter(VaultRepository):
     def list_note_paths_in(self, directory: Path) -> list[Path]:
         """List .md file paths in a directory (relative to vault). Returns empty list if dir missing."""
         full_dir = self._resolve_path(directory)
-        if not full_dir.exists() or not full_dir.is_dir():
+        try:
+            with os.scandir(full_dir) as it:
+                names = [e.name for e in it if e.name.endswith(".md") and not e.is_dir()]
+        except OSError:
             return []
-        return sorted(
-            p.relative_to(self.vault_root)
-            for p in full_dir.glob("*.md")
-        )
+        rel_dir = full_dir.relative_to(self.vault_root)
+        return sorted(rel_dir / name for name in names)
 
     def read_raw(self, path: Path) -> str | None:
         """Return raw file content or None if not found. No frontmatter parsing."""
-        full_path = self._resolve_path(path)
-        if not full_path.exists():
-            return None
         try:
-            return full_path.read_text(encoding="utf-8")
+            text = _read_file_text(self._resolve_path(path))
         except Exception:
             return None
+        # Match text-mode reads: universal newlines.
+        if "\r" in text:
+            text = text.replace("\r\n", "\n").replace("\r", "\n")
+        return text
+
+    def read_frontmatter(self, path: Path) -> dict | None:
+        """Return raw frontmatter metadata without loading the body. None if not found or unparseable."""
+        return _load_metadata(self._resolve_path(path))
 
     def delete_note(self, path: Path) -> None:
         """Delete the file at path."""
         full_path = self._resolve_path(path)
+        self._invalidate(full_path)
         if full_path.exists():
             full_path.unlink()
@@ -1,5 +1,17 @@
 """LLM adapters for AI operations."""
 
-from src_v2.infrastructure.llm.adapters import GeminiAdapter
+from importlib import import_module
 
-__all__ = ["GeminiAdapter"]
+# Imported on first access (PEP 562): CachedLLMProvider does not need the Gemini SDK.
+_EXPORTS = {
+    "CachedLLMProvider": "src_v2.infrastructure.llm.cache",
+    "GeminiAdapter": "src_v2.infrastructure.llm.adapters",
+}
+
+__all__ = ["CachedLLMProvider", "GeminiAdapter"]
+
+
+def __getattr__(name: str):
+    if name in _EXPORTS:
+        return getattr(import_module(_EXPORTS[name]), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
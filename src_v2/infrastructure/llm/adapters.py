@@ -1,11 +1,20 @@
 """LLM adapters for AI operations."""
 
+import hashlib
+import logging
 import os
+import threading
+import time
 
 import google.generativeai as genai
+from google.api_core import exceptions as api_exceptions
+from google.api_core.retry import Retry, if_exception_type
 from google.generativeai.types import GenerationConfig
 
 from src_v2.core.interfaces.ports import LLMProvider
+from src_v2.core.response_parser import split_batch_response
+
+logger = logging.getLogger(__name__)
 
 ARCHITECT_SYSTEM_PROMPT = """
 You are an Obsidian Assistant. Your goal is to organize notes and create structured knowledge.
@@ -40,6 +49,88 @@ RULES:
 5. Extract folder paths from the suggested file paths.
 """
 
+PROPOSAL_PROMPT_TEMPLATE = """
+=== USER INSTRUCTIONS ===
+{instructions}
+
+=== RAW NOTE CONTENT ===
+{body}
+{context_section}
+Please generate a multi-file proposal following the output format.
+"""
+
+BATCH_PROMPT_TEMPLATE = """
+The notes below are independent. Produce a separate proposal for each one, following the
+output format, and start each proposal with a line containing only %%BATCH_ITEM: <n>%%
+where <n> is the note's number.
+
+{notes}{context_section}
+Please generate one multi-file proposal per note, in note order.
+"""
+
+# Left out of the prompt when the context is already held in a Gemini context cache.
+CONTEXT_SECTION_TEMPLATE = """
+=== VAULT CONTEXT ===
+{context}
+"""
+
+# Transient API errors are retried with jittered exponential backoff. The SDK's default
+# only retries 503s, so a 429 would otherwise fail the note outright.
+TRANSIENT_ERRORS = (
+    api_exceptions.ResourceExhausted,
+    api_exceptions.ServiceUnavailable,
+    api_exceptions.DeadlineExceeded,
+    api_exceptions.InternalServerError,
+)
+RETRY_POLICY = Retry(
+    predicate=if_exception_type(*TRANSIENT_ERRORS),
+    initial=1.0,
+    maximum=30.0,
+    multiplier=2.0,
+    timeout=180.0,
+)
+# After this many consecutive calls fail even with retries, calls fail fast for the cooldown.
+CIRCUIT_FAILURE_THRESHOLD = 3
+CIRCUIT_COOLDOWN_SECONDS = 60.0
+
+MAX_OUTPUT_TOKENS = 8192
+OUTPUT_TOKEN_STEP = 1024
+
+# Gemini rejects context caches below a minimum token count; smaller contexts are sent inline.
+CONTEXT_CACHE_MIN_CHARS = 8192
+# A context cache is rebuilt this long before it expires on the server (at most half its TTL).
+CONTEXT_CACHE_REFRESH_MARGIN = 60.0
+# After a failed cache upload, prompts are sent inline for this long before trying again.
+CONTEXT_CACHE_RETRY_SECONDS = 300.0
+
+BATCH_NOTE_TEMPLATE = """=== NOTE {number} ===
+=== USER INSTRUCTIONS ===
+{instructions}
+
+=== RAW NOTE CONTENT ===
+{body}
+
+"""
+
+
+def _output_token_budget(body_chars: int) -> int:
+    """
+    Output cap for a proposal over a note of body_chars characters.
+
+    A proposal is mostly a rewrite of the note: at ~4 characters per token, one token per
+    body character leaves 4x headroom, plus one step for frontmatter and explanation.
+    Rounded up to OUTPUT_TOKEN_STEP so only a handful of configs are ever built.
+    """
+    steps = -(-(body_chars + OUTPUT_TOKEN_STEP) // OUTPUT_TOKEN_STEP)
+    return min(MAX_OUTPUT_TOKENS, steps * OUTPUT_TOKEN_STEP)
+
+
+def _hit_token_limit(response) -> bool:
+    """True if generation stopped because max_output_tokens was reached."""
+    candidates = getattr(response, "candidates", None) or []
+    reason = getattr(candidates[0], "finish_reason", None) if candidates else None
+    return getattr(reason, "name", reason) == "MAX_TOKENS"
+
 
 class GeminiAdapter(LLMProvider):
     """Adapter for Google Gemini API."""
@@ -49,30 +140,176 @@ class GeminiAdapter(LLMProvider):
         *,
         model_name: str = "gemini-2.5-flash",
         api_key: str | None = None,
+        context_cache_ttl: int = 0,
     ) -> None:
         key = api_key or os.getenv("GEMINI_API_KEY")
         if not key:
             raise ValueError("GEMINI_API_KEY environment variable not set.")
         genai.configure(api_key=key)
         self.model_name = model_name
+        # Built on first use and reused: none of these vary between calls.
+        self._generation_configs: dict[int, GenerationConfig] = {}
+        self._text_model: genai.GenerativeModel | None = None
+        self._architect_model: genai.GenerativeModel | None = None
+        # Server-side context cache for proposal prompts; 0 disables it.
+        self.context_cache_ttl = context_cache_ttl
+        self._context_lock = threading.Lock()
+        self._context_digest: str | None = None
+        self._context_cache: genai.caching.CachedContent | None = None
+        self._context_model: genai.GenerativeModel | None = None
+        self._context_refresh_at = 0.0  # time.time() after which the cache is rebuilt
+        self._circuit_lock = threading.Lock()
+        self._consecutive_failures = 0
+        self._circuit_open_until = 0.0
 
-    def _get_generation_config(self) -> GenerationConfig:
-        return GenerationConfig(
-            temperature=0.0,
-            top_p=0.95,
-            top_k=40,
-            max_output_tokens=8192,
-        )
+    @property
+    def cache_namespace(self) -> str:
+        """Identity for response caches: model name plus a digest of the prompts it is sent with."""
+        prompts = (
+            ARCHITECT_SYSTEM_PROMPT + PROPOSAL_PROMPT_TEMPLATE + BATCH_PROMPT_TEMPLATE + CONTEXT_SECTION_TEMPLATE
+        ).encode("utf-8")
+        return f"{self.model_name}:{hashlib.sha256(prompts).hexdigest()[:12]}"
+
+    def _get_generation_config(self, max_output_tokens: int = MAX_OUTPUT_TOKENS) -> GenerationConfig:
+        config = self._generation_configs.get(max_output_tokens)
+        if config is None:
+            config = GenerationConfig(
+                temperature=0.0,
+                top_p=0.95,
+                top_k=40,
+                max_output_tokens=max_output_tokens,
+            )
+            self._generation_configs[max_output_tokens] = config
+        return config
+
+    def _generate(self, model: genai.GenerativeModel, prompt: str, generation_config: GenerationConfig):
+        """
+        Call generate_content with RETRY_POLICY behind a simple circuit breaker.
+
+        Raises:
+            ServiceUnavailable: Without calling the API, while the circuit is open.
+        """
+        if time.monotonic() < self._circuit_open_until:
+            raise api_exceptions.ServiceUnavailable("Gemini calls paused after repeated transient failures")
+        try:
+            response = model.generate_content(
+                prompt,
+                generation_config=generation_config,
+                request_options={"retry": RETRY_POLICY},
+            )
+        except TRANSIENT_ERRORS:
+            with self._circuit_lock:
+                self._consecutive_failures += 1
+                if self._consecutive_failures >= CIRCUIT_FAILURE_THRESHOLD:
+                    self._circuit_open_until = time.monotonic() + CIRCUIT_COOLDOWN_SECONDS
+            raise
+        with self._circuit_lock:
+            self._consecutive_failures = 0
+        return response
+
+    def _generate_with_budget(self, model: genai.GenerativeModel, prompt: str, body_chars: int):
+        """Generate with an output cap sized to the note, retrying at the full cap if it is hit."""
+        budget = _output_token_budget(body_chars)
+        response = self._generate(model, prompt, self._get_generation_config(budget))
+        if budget < MAX_OUTPUT_TOKENS and _hit_token_limit(response):
+            response = self._generate(model, prompt, self._get_generation_config())
+        return response
 
     def generate_text(self, prompt: str) -> str:
         """Generate text from a prompt."""
-        model = genai.GenerativeModel(self.model_name)
-        response = model.generate_content(
-            prompt,
-            generation_config=self._get_generation_config(),
-        )
+        if self._text_model is None:
+            self._text_model = genai.GenerativeModel(self.model_name)
+        response = self._generate(self._text_model, prompt, self._get_generation_config())
         return response.text
 
+    def _get_architect_model(self) -> genai.GenerativeModel:
+        if self._architect_model is None:
+            self._architect_model = genai.GenerativeModel(
+                self.model_name,
+                system_instruction=ARCHITECT_SYSTEM_PROMPT,
+            )
+        return self._architect_model
+
+    def _get_proposal_model(self, context: str) -> tuple[genai.GenerativeModel, str]:
+        """
+        Return the model to send a proposal prompt to and the context section for the prompt.
+
+        With context caching enabled, the system prompt and vault context are uploaded once
+        as a Gemini CachedContent and reused until the context changes or the cache nears
+        its expire_time, so each request only carries the note. The cache it replaces is
+        deleted. Otherwise, or while an upload keeps failing, the context is sent inline.
+        """
+        context_section = CONTEXT_SECTION_TEMPLATE.format(context=context)
+        if not self.context_cache_ttl or len(context) < CONTEXT_CACHE_MIN_CHARS:
+            return self._get_architect_model(), context_section
+
+        digest = hashlib.sha1(context.encode("utf-8")).hexdigest()
+        with self._context_lock:
+            if digest != self._context_digest or time.time() >= self._context_refresh_at:
+                self._replace_context_cache(digest, context_section)
+            context_model = self._context_model
+
+        if context_model is None:
+            return self._get_architect_model(), context_section
+        return context_model, ""
+
+    def _replace_context_cache(self, digest: str, context_section: str) -> None:
+        """Delete the current context cache and upload a new one. Call with _context_lock held."""
+        if self._context_cache is not None:
+            try:
+                self._context_cache.delete()
+            except Exception as e:
+                # It still expires on its own at the end of its TTL.
+                logger.warning("Could not delete Gemini context cache %s: %s", self._context_cache.name, e)
+        self._context_digest = digest
+        self._context_cache = None
+        self._context_model = None
+        try:
+            cached = genai.caching.CachedContent.create(
+                model=self.model_name,
+                display_name=f"vault-context-{digest[:12]}",
+                system_instruction=ARCHITECT_SYSTEM_PROMPT,
+                contents=[context_section],
+                ttl=self.context_cache_ttl,
+            )
+            model = genai.GenerativeModel.from_cached_content(cached)
+        except Exception as e:
+            # Not fatal: prompts for this context are sent inline until the next attempt.
+            logger.warning("Gemini context cache creation failed, sending context inline: %s", e)
+            self._context_refresh_at = time.time() + CONTEXT_CACHE_RETRY_SECONDS
+            return
+        margin = min(CONTEXT_CACHE_REFRESH_MARGIN, self.context_cache_ttl / 2)
+        self._context_cache = cached
+        self._context_model = model
+        self._context_refresh_at = cached.expire_time.timestamp() - margin
+
+    def _drop_context_model(self, model: genai.GenerativeModel) -> None:
+        """Forget a context cache the server no longer has, so the next request rebuilds it."""
+        with self._context_lock:
+            if self._context_model is model:
+                self._context_digest = None
+                self._context_cache = None
+                self._context_model = None
+
+    def _generate_proposal_response(self, context: str, prompt_template: str, body_chars: int, **fields: str):
+        """
+        Fill prompt_template and generate with the proposal model for context.
+
+        If the context cache has gone from the server (expired or deleted), it is dropped
+        and the prompt is sent again with the context inline.
+        """
+        model, context_section = self._get_proposal_model(context)
+        try:
+            prompt = prompt_template.format(context_section=context_section, **fields)
+            return self._generate_with_budget(model, prompt, body_chars)
+        except api_exceptions.NotFound:
+            if context_section:
+                raise
+            logger.warning("Gemini context cache not found; resending with the context inline")
+            self._drop_context_model(model)
+        prompt = prompt_template.format(context_section=CONTEXT_SECTION_TEMPLATE.format(context=context), **fields)
+        return self._generate_with_budget(self._get_architect_model(), prompt, body_chars)
+
     def generate_proposal(
         self,
         instructions: str,
@@ -81,24 +318,42 @@ class GeminiAdapter(LLMProvider):
         skeleton: str,
     ) -> str:
         """Generate a multi-file proposal. Returns raw LLM response with %%FILE%% markers."""
-        architect_model = genai.GenerativeModel(
-            self.model_name,
-            system_instruction=ARCHITECT_SYSTEM_PROMPT,
+        response = self._generate_proposal_response(
+            context, PROPOSAL_PROMPT_TEMPLATE, len(body), instructions=instructions, body=body
         )
-        user_prompt = f"""
-=== USER INSTRUCTIONS ===
-{instructions}
+        return response.text
 
-=== RAW NOTE CONTENT ===
-{body}
+    def generate_proposals(
+        self,
+        items: list[tuple[str, str]],
+        context: str,
+        skeleton: str,
+    ) -> list[str]:
+        """
+        Generate proposals for several notes in a single request.
 
-=== VAULT CONTEXT ===
-{context}
+        The notes are numbered in one prompt and the model separates its answers with
+        %%BATCH_ITEM: n%% markers. Items whose answer is missing from the response
+        (e.g. output cut off at the token limit) are retried with generate_proposal.
+        """
+        if len(items) <= 1:
+            return super().generate_proposals(items, context, skeleton)
 
-Please generate a multi-file proposal following the output format.
-"""
-        response = architect_model.generate_content(
-            user_prompt,
-            generation_config=self._get_generation_config(),
+        notes = "".join(
+            BATCH_NOTE_TEMPLATE.format(number=number, instructions=instructions, body=body)
+            for number, (instructions, body) in enumerate(items, start=1)
         )
-        return response.text
+        response = self._generate_proposal_response(
+            context, BATCH_PROMPT_TEMPLATE, sum(len(body) for _, body in items), notes=notes
+        )
+        answers = split_batch_response(response.text, len(items))
+        if _hit_token_limit(response):
+            # The last answer that did arrive may have been cut short.
+            for i in reversed(range(len(answers))):
+                if answers[i] is not None:
+                    answers[i] = None
+                    break
+        return [
+            answer if answer is not None else self.generate_proposal(instructions, body, context, skeleton)
+            for answer, (instructions, body) in zip(answers, items)
+        ]
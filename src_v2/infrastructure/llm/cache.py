@@ -0,0 +1,143 @@
+"""Persistent response cache for LLM providers."""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+from src_v2.core.interfaces.ports import LLMProvider
+
+
+def _normalize_for_key(text: str) -> str:
+    """Normalize line endings for cache keys; everything else, trailing spaces included, is kept."""
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+class CachedLLMProvider(LLMProvider):
+    """
+    LLMProvider decorator that stores responses in SQLite, keyed by a hash of the request.
+
+    Generation runs at temperature 0, so replaying a stored response for an identical
+    request (same provider namespace, method and arguments) is safe and skips the API
+    round-trip. Arguments are compared after normalizing line endings, which do not
+    change what the model is asked to do. Trailing spaces are kept: in Markdown they
+    can be hard line breaks, and the proposal reproduces the body as given.
+
+    The namespace defaults to the provider's cache_namespace, so changing the model or
+    its prompts starts a fresh cache. With max_age set, entries older than that many
+    seconds are treated as misses and refreshed. Cache read/write failures fall through
+    to the wrapped provider.
+    """
+
+    def __init__(
+        self,
+        inner: LLMProvider,
+        db_path: Path | str,
+        *,
+        namespace: str | None = None,
+        max_age: int = 0,
+    ) -> None:
+        self.inner = inner
+        self.namespace = namespace or getattr(inner, "cache_namespace", type(inner).__name__)
+        self.max_age = max_age
+        db_path = Path(db_path)
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        # One connection shared by worker threads; statements are serialized by the lock.
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, response TEXT NOT NULL, ts INTEGER NOT NULL)"
+            )
+
+    def _cache_key(self, method: str, **params: str) -> str:
+        normalized = {name: _normalize_for_key(value) for name, value in params.items()}
+        payload = json.dumps({"namespace": self.namespace, "method": method, **normalized}, sort_keys=True)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _get(self, key: str) -> str | None:
+        try:
+            with self._lock:
+                row = self._conn.execute("SELECT response, ts FROM cache WHERE key = ?", (key,)).fetchone()
+        except sqlite3.Error:
+            return None
+        if row is None or (self.max_age and row[1] < time.time() - self.max_age):
+            return None
+        return row[0]
+
+    def _put(self, key: str, response: str) -> None:
+        try:
+            with self._lock, self._conn:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO cache (key, response, ts) VALUES (?, ?, ?)",
+                    (key, response, int(time.time())),
+                )
+        except sqlite3.Error:
+            pass
+
+    def generate_text(self, prompt: str) -> str:
+        """Generate text from a prompt, replaying a cached response when available."""
+        key = self._cache_key("generate_text", prompt=prompt)
+        cached = self._get(key)
+        if cached is not None:
+            return cached
+        response = self.inner.generate_text(prompt)
+        self._put(key, response)
+        return response
+
+    def generate_proposal(
+        self,
+        instructions: str,
+        body: str,
+        context: str,
+        skeleton: str,
+    ) -> str:
+        """Generate a multi-file proposal, replaying a cached response when available."""
+        key = self._cache_key(
+            "generate_proposal",
+            instructions=instructions,
+            body=body,
+            context=context,
+            skeleton=skeleton,
+        )
+        cached = self._get(key)
+        if cached is not None:
+            return cached
+        response = self.inner.generate_proposal(instructions, body, context, skeleton)
+        self._put(key, response)
+        return response
+
+    def generate_proposals(
+        self,
+        items: list[tuple[str, str]],
+        context: str,
+        skeleton: str,
+    ) -> list[str]:
+        """Generate proposals for several notes; only uncached items are sent to the wrapped provider."""
+        keys = [
+            self._cache_key(
+                "generate_proposal",
+                instructions=instructions,
+                body=body,
+                context=context,
+                skeleton=skeleton,
+            )
+            for instructions, body in items
+        ]
+        results = [self._get(key) for key in keys]
+        misses = [i for i, cached in enumerate(results) if cached is None]
+        if misses:
+            responses = self.inner.generate_proposals([items[i] for i in misses], context, skeleton)
+            for i, response in zip(misses, responses):
+                self._put(keys[i], response)
+                results[i] = response
+        return results
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
@@ -5,6 +5,7 @@ from pathlib import Path
 
 from src_v2.core.domain.models import CodeRegistryEntry, Note, ValidationResult
 from src_v2.core.interfaces.ports import LLMProvider, VaultRepository
+from src_v2.core.vault_utils import note_to_raw_content
 
 
 class MockVaultAdapter(VaultRepository):
@@ -31,6 +32,19 @@ class MockVaultAdapter(VaultRepository):
         """Persist a note to the given path."""
         self.files[path] = note
 
+    def create_note(self, path: Path, note: Note) -> Path:
+        """Store a note under path, or its first free -N variant. Returns the path used."""
+        candidate, counter = path, 0
+        while candidate in self.files or candidate in self._raw_content:
+            counter += 1
+            candidate = path.with_name(f"{path.stem}-{counter}{path.suffix}")
+        self.files[candidate] = note
+        return candidate
+
+    def save_notes(self, notes: dict[Path, Note]) -> None:
+        """Persist a batch of notes, keyed by destination path."""
+        self.files.update(notes)
+
     def scan_vault(self) -> list[ValidationResult]:
         """Return pre-configured scan results."""
         return list(self._scan_results)
@@ -63,10 +77,15 @@ class MockVaultAdapter(VaultRepository):
         if path in self._raw_content:
             return self._raw_content[path]
         if path in self.files:
-            note = self.files[path]
-            metadata = note.frontmatter.model_dump(exclude_none=False)
-            post = frontmatter.Post(note.body, **metadata)
-            return frontmatter.dumps(post)
+            return note_to_raw_content(self.files[path])
+        return None
+
+    def read_frontmatter(self, path: Path) -> dict | None:
+        """Return frontmatter metadata for a seeded note or raw content, else None."""
+        if path in self.files:
+            return self.files[path].frontmatter.model_dump()
+        if path in self._raw_content:
+            return dict(frontmatter.loads(self._raw_content[path]).metadata)
         return None
 
     def delete_note(self, path: Path) -> None:
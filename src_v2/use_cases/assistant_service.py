@@ -1,9 +1,20 @@
 """Assistant Service - The Doer (Agentic Coding)."""
 
-import frontmatter
-
 from src_v2.config.context_config import ContextConfig
 from src_v2.core.interfaces.ports import LLMProvider, VaultRepository
+from src_v2.core.vault_utils import note_to_raw_content
+from src_v2.use_cases.librarian_service import LibrarianService
+
+
+def _truncate_skeleton(skeleton: str, max_chars: int) -> str:
+    """Cut the skeleton to whole lines within max_chars (0 = no cap), noting how many were dropped."""
+    if not max_chars or len(skeleton) <= max_chars:
+        return skeleton
+    cut = skeleton.rfind("\n", 0, max_chars + 1)
+    kept = skeleton[:cut] if cut != -1 else ""
+    omitted = skeleton.count("\n", len(kept)) + (0 if kept else 1)
+    marker = f"- ... ({omitted} more notes omitted)"
+    return f"{kept}\n{marker}" if kept else marker
 
 
 class AssistantService:
@@ -26,9 +37,7 @@ class AssistantService:
         note = self.repo.get_note(Path(relative_path))
         if not note:
             return ""
-        metadata = note.frontmatter.model_dump(exclude_none=False)
-        post = frontmatter.Post(note.body, **metadata)
-        return frontmatter.dumps(post)
+        return note_to_raw_content(note)
 
     def get_full_context(self) -> str:
         """
@@ -40,14 +49,10 @@ class AssistantService:
         instructions = self._read_file_content(self.config.system_instructions_path)
         glossary = self._read_file_content(self.config.tag_glossary_path)
 
-        entries = self.repo.get_code_registry_entries()
-        sorted_entries = sorted(entries, key=lambda e: e.folder)
-        registry_lines = ["| Code | Name | Type | Folder |", "| :--- | :--- | :--- | :--- |"]
-        for entry in sorted_entries:
-            registry_lines.append(f"| {entry.code} | {entry.name} | {entry.type} | {entry.folder} |")
-        registry = "\n".join(registry_lines)
+        registry = LibrarianService(self.repo).generate_registry()
 
-        skeleton = self.repo.get_skeleton()
+        # The vault map grows with the vault; the other sections are small and always kept whole.
+        skeleton = _truncate_skeleton(self.repo.get_skeleton(), self.config.max_skeleton_chars)
 
         return f"""
 === SYSTEM INSTRUCTIONS ===
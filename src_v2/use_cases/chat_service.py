@@ -104,6 +104,14 @@ class ChatService:
         genai.configure(api_key=key)
         self.model_name = model_name
         self._tools = _build_tools()
+        # The system prompt depends on the active area, so models are kept per area.
+        self._models: dict[str, genai.GenerativeModel] = {}
+        self._generation_config = GenerationConfig(
+            temperature=0.0,
+            top_p=0.95,
+            top_k=40,
+            max_output_tokens=8192,
+        )
 
     def _list_files_in_area(self, active_area: str, relative_path: str) -> str:
         """List .md files in directory. Returns JSON array of paths or error message."""
@@ -148,21 +156,17 @@ class ChatService:
         Returns:
             Final assistant text response.
         """
-        system_instruction = ANALYST_SYSTEM_PROMPT.format(active_area=active_area)
-        model = genai.GenerativeModel(
-            self.model_name,
-            system_instruction=system_instruction,
-            tools=self._tools,
-        )
+        model = self._models.get(active_area)
+        if model is None:
+            model = genai.GenerativeModel(
+                self.model_name,
+                system_instruction=ANALYST_SYSTEM_PROMPT.format(active_area=active_area),
+                tools=self._tools,
+            )
+            self._models[active_area] = model
         chat = model.start_chat()
-        config = GenerationConfig(
-            temperature=0.0,
-            top_p=0.95,
-            top_k=40,
-            max_output_tokens=8192,
-        )
 
-        response = chat.send_message(user_message, generation_config=config)
+        response = chat.send_message(user_message, generation_config=self._generation_config)
         iterations = 0
 
         while iterations < MAX_REACT_ITERATIONS:
@@ -192,7 +196,7 @@ class ChatService:
                 fr = FunctionResponse(name=name, response=response_dict)
                 response = chat.send_message(
                     Content(role="user", parts=[Part(function_response=fr)]),
-                    generation_config=config,
+                    generation_config=self._generation_config,
                 )
                 continue
 
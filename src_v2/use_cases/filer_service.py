@@ -1,18 +1,15 @@
 """Filer Service - Execute approved proposals (librarian: file) from Review Queue."""
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-import frontmatter
-
-from src_v2.core.domain.models import Frontmatter, Note
+from src_v2.core.domain.models import Note
 from src_v2.core.interfaces.ports import VaultRepository
 from src_v2.core.response_parser import parse_proposal
-from src_v2.core.vault_utils import get_safe_path
-
+from src_v2.core.vault_utils import get_safe_path, note_from_raw_content, strip_frontmatter
 
-def _metadata_to_frontmatter(metadata: dict) -> Frontmatter:
-    """Convert raw metadata dict to Frontmatter model."""
-    return Frontmatter.model_validate(metadata)
+SCREEN_WORKERS = 8
+PARALLEL_SCREEN_THRESHOLD = 16  # Smaller queues are screened serially
 
 
 class FilerService:
@@ -29,6 +26,23 @@ class FilerService:
         self.review_dir = Path(review_dir)
         self.vault_root = Path(vault_root)
 
+    def _screen_proposals(self, paths: list[Path]) -> list[tuple[Path, dict]]:
+        """
+        Return (path, metadata) for proposals marked librarian: file, in queue order.
+
+        Only frontmatter headers are read; large queues are screened on a thread pool.
+        """
+        if len(paths) < PARALLEL_SCREEN_THRESHOLD:
+            headers = [self.repo.read_frontmatter(p) for p in paths]
+        else:
+            with ThreadPoolExecutor(max_workers=SCREEN_WORKERS) as executor:
+                headers = list(executor.map(self.repo.read_frontmatter, paths))
+        return [
+            (path, metadata)
+            for path, metadata in zip(paths, headers)
+            if metadata and metadata.get("librarian") == "file"
+        ]
+
     def file_approved_notes(self) -> int:
         """
         Execute proposals with librarian: file.
@@ -44,24 +58,27 @@ class FilerService:
             return 0
 
         files_created_total = 0
-
-        for prop_path in paths:
-            note = self.repo.get_note(prop_path)
-            if note is None:
-                continue
-
-            librarian = note.frontmatter.model_dump().get("librarian")
-            if librarian != "file":
+        # Directory listings shared by every proposal, so collision checks never stat per candidate.
+        listings: dict[Path, set[str]] = {}
+        next_suffix: dict[Path, int] = {}
+
+        for prop_path, metadata in self._screen_proposals(paths):
+            # The header was already parsed during screening; only the body is needed now.
+            raw = self.repo.read_raw(prop_path)
+            if raw is None:
                 continue
 
-            parsed = parse_proposal(note.body)
+            parsed = parse_proposal(strip_frontmatter(raw))
             if not parsed["files"]:
                 continue
 
-            target_file = note.frontmatter.model_dump().get("target-file")
+            target_file = metadata.get("target-file")
             is_maintenance_fix = target_file is not None
             original_handled = False
-            files_created_this_proposal = 0
+            # Written in one batch per proposal; reserved paths keep collision handling
+            # aware of earlier files in the same batch before they reach disk.
+            pending: dict[Path, Note] = {}
+            reserved: set[Path] = set()
 
             for file_data in parsed["files"]:
                 rel_path = file_data["path"]
@@ -78,28 +95,28 @@ class FilerService:
                     if is_rename and not original_handled:
                         if self.repo.read_raw(Path(target_file)) is not None:
                             self.repo.delete_note(Path(target_file))
+                            original_full = self.vault_root / target_file
+                            listings.get(original_full.parent, set()).discard(original_full.name)
                         original_handled = True
-                        safe_full = get_safe_path(full_target_path)
+                        safe_full = get_safe_path(full_target_path, reserved, listings, next_suffix)
                     elif not is_rename and not original_handled:
                         safe_full = full_target_path
                         original_handled = True
                     else:
-                        safe_full = get_safe_path(full_target_path)
+                        safe_full = get_safe_path(full_target_path, reserved, listings, next_suffix)
                 else:
-                    safe_full = get_safe_path(full_target_path)
+                    safe_full = get_safe_path(full_target_path, reserved, listings, next_suffix)
+                reserved.add(safe_full)
 
                 safe_rel = safe_full.relative_to(self.vault_root)
-                try:
-                    post = frontmatter.loads(content)
-                except Exception:
-                    post = frontmatter.Post(content, **{})
-                fm = _metadata_to_frontmatter(dict(post.metadata))
-                file_note = Note(path=safe_rel, frontmatter=fm, body=post.content or "")
-                self.repo.save_note(safe_rel, file_note)
-                files_created_this_proposal += 1
-                files_created_total += 1
-
-            if files_created_this_proposal > 0:
+                pending[safe_rel] = note_from_raw_content(safe_rel, content)
+
+            if pending:
+                self.repo.save_notes(pending)
+                for written in reserved:
+                    if written.parent in listings:
+                        listings[written.parent].add(written.name)
+                files_created_total += len(pending)
                 self.repo.delete_note(prop_path)
 
         return files_created_total
@@ -1,16 +1,19 @@
 """Ingestion Service - Capture to Review Queue pipeline."""
 
+import os
 import re
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 
-import frontmatter
-
 from src_v2.core.domain.models import Frontmatter, Note
 from src_v2.core.interfaces.ports import LLMProvider, VaultRepository
 from src_v2.core.response_parser import parse_proposal
-from src_v2.core.vault_utils import get_safe_path, sanitize_filename
+from src_v2.core.vault_utils import sanitize_filename
+
+INGEST_WORKERS = 4
+LLM_INSTRUCTIONS_RE = re.compile(r"```LLM-Instructions\s*(.*?)```", re.DOTALL)
 
 
 @dataclass
@@ -23,11 +26,10 @@ class IngestionResult:
 
 def _extract_instructions(content: str) -> tuple[str | None, str]:
     """Extract LLM-Instructions block from note content. Returns (instructions, cleaned_body)."""
-    pattern = r"```LLM-Instructions\s*(.*?)```"
-    match = re.search(pattern, content, re.DOTALL)
+    match = LLM_INSTRUCTIONS_RE.search(content)
     if match:
         instructions = match.group(1).strip()
-        cleaned_body = re.sub(pattern, "", content, flags=re.DOTALL).strip()
+        cleaned_body = LLM_INSTRUCTIONS_RE.sub("", content).strip()
         return instructions, cleaned_body
     return None, content
 
@@ -44,6 +46,8 @@ class IngestionService:
         review_dir: str,
         vault_root: Path,
         context_builder: "ContextBuilder | None" = None,
+        batch_size: int = 1,
+        workers: int = INGEST_WORKERS,
     ) -> None:
         self.repo = repo
         self.llm = llm
@@ -51,6 +55,8 @@ class IngestionService:
         self.review_dir = Path(review_dir)
         self.vault_root = Path(vault_root)
         self._context_builder = context_builder
+        self.batch_size = max(1, batch_size)
+        self.workers = max(1, workers)
 
     def _build_context(self) -> str:
         """Build full vault context for LLM (system instructions, glossary, registry, skeleton)."""
@@ -77,46 +83,80 @@ class IngestionService:
         if not paths:
             return IngestionResult(processed_count=0, success=True)
 
-        context = self._build_context()
-        skeleton = self._get_skeleton()
+        # The vault context is built in the background while the captures are read.
+        with ThreadPoolExecutor(max_workers=1) as prep:
+            context_future = prep.submit(lambda: (self._build_context(), self._get_skeleton()))
+
+            captures: list[tuple[Path, str, str]] = []
+            for capture_path in paths:
+                raw_content = self.repo.read_raw(capture_path)
+                if raw_content is None:
+                    continue
+
+                instructions, body = _extract_instructions(raw_content)
+                if not instructions:
+                    instructions = "Organize this note using standard conventions."
+                captures.append((capture_path, instructions, body))
+
+            context, skeleton = context_future.result()
         processed = 0
 
-        for capture_path in paths:
-            raw_content = self.repo.read_raw(capture_path)
-            if raw_content is None:
-                continue
+        if not captures:
+            return IngestionResult(processed_count=0, success=True)
 
-            instructions, body = _extract_instructions(raw_content)
-            if not instructions:
-                instructions = "Organize this note using standard conventions."
+        # Captures are sent to the LLM in batches of batch_size notes per request.
+        batches = [captures[i:i + self.batch_size] for i in range(0, len(captures), self.batch_size)]
 
+        def request_proposals(batch: list[tuple[Path, str, str]]) -> list[str] | Exception:
             try:
-                llm_response = self.llm.generate_proposal(
-                    instructions=instructions,
-                    body=body,
-                    context=context,
-                    skeleton=skeleton,
-                )
-            except Exception:
-                return IngestionResult(processed_count=processed, success=False)
-
-            parsed = parse_proposal(llm_response)
-            file_paths = [f["path"] for f in parsed["files"]]
-            folders = list({str(Path(p).parent) for p in file_paths if p})
-
-            if file_paths:
-                first_file = Path(file_paths[0])
-                base_name = first_file.stem
-            else:
-                base_name = f"proposal-{int(time.time())}"
-
-            safe_filename = sanitize_filename(base_name)
-            new_filename = f"{safe_filename}.md"
-            full_review_path = self.vault_root / self.review_dir / new_filename
-            safe_full_path = get_safe_path(full_review_path)
-            review_path = safe_full_path.relative_to(self.vault_root)
-
-            proposal_content = f"""%%INSTRUCTIONS%%
+                if len(batch) == 1:
+                    _, instructions, body = batch[0]
+                    return [
+                        self.llm.generate_proposal(
+                            instructions=instructions,
+                            body=body,
+                            context=context,
+                            skeleton=skeleton,
+                        )
+                    ]
+                items = [(instructions, body) for _, instructions, body in batch]
+                return self.llm.generate_proposals(items, context=context, skeleton=skeleton)
+            except Exception as e:
+                return e
+
+        # LLM calls overlap; results are applied in capture order so review-queue
+        # naming and the stop-on-first-failure behaviour match a serial run.
+        executor = ThreadPoolExecutor(max_workers=min(self.workers, len(batches)))
+        try:
+            responses = executor.map(request_proposals, batches)
+            for batch, llm_responses in zip(batches, responses):
+                if isinstance(llm_responses, Exception):
+                    return IngestionResult(processed_count=processed, success=False)
+                for (capture_path, instructions, body), llm_response in zip(batch, llm_responses):
+                    self._file_proposal(capture_path, instructions, body, llm_response)
+                    processed += 1
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+        return IngestionResult(processed_count=processed, success=True)
+
+    def _file_proposal(self, capture_path: Path, instructions: str, body: str, llm_response: str) -> None:
+        """Save one LLM response to the Review Queue and delete the capture it came from."""
+        parsed = parse_proposal(llm_response)
+        file_paths = [f["path"] for f in parsed["files"]]
+        # First-seen order keeps folders-to-create stable between runs; dirname avoids a Path per file.
+        folders = list(dict.fromkeys(os.path.dirname(p) or "." for p in file_paths if p))
+
+        if file_paths:
+            first_file = Path(file_paths[0])
+            base_name = first_file.stem
+        else:
+            base_name = f"proposal-{int(time.time())}"
+
+        safe_filename = sanitize_filename(base_name)
+        review_path = self.review_dir / f"{safe_filename}.md"
+
+        proposal_content = f"""%%INSTRUCTIONS%%
 {instructions}
 ---
 %%ORIGINAL%%
@@ -124,18 +164,16 @@ class IngestionService:
 ---
 {llm_response}
 """
-            fm = Frontmatter.model_validate({
-                "folders-to-create": folders,
-                "files-to-create": file_paths,
-                "librarian": "review",
-            })
-            note = Note(path=review_path, frontmatter=fm, body=proposal_content)
-
-            self.repo.save_note(review_path, note)
-            self.repo.delete_note(capture_path)
-            processed += 1
-
-        return IngestionResult(processed_count=processed, success=True)
+        fm = Frontmatter.model_validate({
+            "folders-to-create": folders,
+            "files-to-create": file_paths,
+            "librarian": "review",
+        })
+        note = Note(path=review_path, frontmatter=fm, body=proposal_content)
+
+        # create_note picks a free -N name if another note already holds review_path.
+        self.repo.create_note(review_path, note)
+        self.repo.delete_note(capture_path)
 
 
 class ContextBuilder:
@@ -2,6 +2,8 @@
 
 from src_v2.core.interfaces.ports import VaultRepository
 
+REGISTRY_HEADER = "| Code | Name | Type | Folder |\n| :--- | :--- | :--- | :--- |"
+
 
 class LibrarianService:
     """Generates the Code Registry Markdown table for the vault."""
@@ -21,7 +23,5 @@ class LibrarianService:
         entries = self.repo.get_code_registry_entries()
         sorted_entries = sorted(entries, key=lambda e: e.folder)
 
-        lines = ["| Code | Name | Type | Folder |", "| :--- | :--- | :--- | :--- |"]
-        for entry in sorted_entries:
-            lines.append(f"| {entry.code} | {entry.name} | {entry.type} | {entry.folder} |")
-        return "\n".join(lines)
+        rows = [f"| {e.code} | {e.name} | {e.type} | {e.folder} |" for e in sorted_entries]
+        return "\n".join([REGISTRY_HEADER, *rows])
@@ -1,11 +1,11 @@
 """Maintenance Service - The Night Watchman."""
 
+from operator import attrgetter
 from pathlib import Path
 
-import frontmatter
-
 from src_v2.core.domain.models import ValidationResult
 from src_v2.core.interfaces.ports import LLMProvider, VaultRepository
+from src_v2.core.vault_utils import note_to_raw_content
 
 
 class MaintenanceService:
@@ -21,7 +21,7 @@ class MaintenanceService:
         self.llm = llm
         self.assistant_service = assistant_service
 
-    def fix_file(self, path: Path) -> str:
+    def fix_file(self, path: Path, context: str | None = None) -> str:
         """
         Validate the note, discover reasons, and generate a fix proposal.
 
@@ -30,6 +30,8 @@ class MaintenanceService:
 
         Args:
             path: Path to the note (relative to vault root).
+            context: Full vault context. If None, built via the assistant service;
+                pass it in when fixing several notes so it is only built once.
 
         Returns:
             str: Raw LLM response with %%FILE%% markers.
@@ -48,7 +50,8 @@ class MaintenanceService:
         validation = self.repo.validate_note(path)
         reasons = validation.reasons if validation else ["Manual fix requested"]
 
-        context = self.assistant_service.get_full_context()
+        if context is None:
+            context = self.assistant_service.get_full_context()
         return self.generate_fix(path, reasons, context)
 
     def audit_vault(self) -> list[ValidationResult]:
@@ -58,9 +61,9 @@ class MaintenanceService:
         Returns:
             list[ValidationResult]: Dirty files, highest score first.
         """
-        all_results = self.repo.scan_vault()
-        dirty = [r for r in all_results if r.score > 0]
-        return sorted(dirty, key=lambda x: x.score, reverse=True)
+        dirty = [r for r in self.repo.scan_vault() if r.score > 0]
+        dirty.sort(key=attrgetter("score"), reverse=True)  # In place; no second copy of the list
+        return dirty
 
     def generate_fix(self, path: Path, reasons: list[str], context: str) -> str:
         """
@@ -83,9 +86,7 @@ class MaintenanceService:
         if not note:
             raise FileNotFoundError(f"Note {path} not found")
 
-        metadata = note.frontmatter.model_dump(exclude_none=False)
-        post = frontmatter.Post(note.body, **metadata)
-        raw_content = frontmatter.dumps(post)
+        raw_content = note_to_raw_content(note)
 
         instructions = (
             f"MAINTENANCE MODE. This note has failed quality checks.\n"
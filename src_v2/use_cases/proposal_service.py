@@ -10,7 +10,6 @@ from google.generativeai.types import GenerationConfig
 from src_v2.core.domain.models import Frontmatter, Note
 from src_v2.core.interfaces.ports import VaultRepository
 from src_v2.core.response_parser import parse_proposal
-from src_v2.core.vault_utils import get_safe_path
 
 PROPOSER_SYSTEM_PROMPT = """You are an Obsidian Proposer. Your role is to draft markdown file updates based on a conversation about a vault area.
 
@@ -74,6 +73,13 @@ class ProposalService:
             raise ValueError("GEMINI_API_KEY required for ProposalService")
         genai.configure(api_key=key)
         self.model_name = model_name
+        self._model: genai.GenerativeModel | None = None
+        self._generation_config = GenerationConfig(
+            temperature=0.0,
+            top_p=0.95,
+            top_k=40,
+            max_output_tokens=8192,
+        )
 
     def _load_area_context(self, active_area: str) -> str:
         """Load file contents from active_area for LLM context."""
@@ -127,21 +133,16 @@ class ProposalService:
 
 Based on this conversation, generate a markdown file proposal. Output using the %%FILE%% format."""
 
-        model = genai.GenerativeModel(
-            self.model_name,
-            system_instruction=PROPOSER_SYSTEM_PROMPT,
-        )
-        config = GenerationConfig(
-            temperature=0.0,
-            top_p=0.95,
-            top_k=40,
-            max_output_tokens=8192,
-        )
+        if self._model is None:
+            self._model = genai.GenerativeModel(
+                self.model_name,
+                system_instruction=PROPOSER_SYSTEM_PROMPT,
+            )
 
         try:
-            response = model.generate_content(
+            response = self._model.generate_content(
                 user_prompt,
-                generation_config=config,
+                generation_config=self._generation_config,
             )
             raw_output = response.text if response and response.text else ""
         except Exception as e:
@@ -163,9 +164,7 @@ Based on this conversation, generate a markdown file proposal. Output using the
         # Build proposal filename and path
         timestamp = int(time.time())
         base_name = f"copilot-draft-{timestamp}"
-        review_path = self.vault_root / self.review_dir / f"{base_name}.md"
-        safe_review_path = get_safe_path(review_path)
-        rel_review_path = safe_review_path.relative_to(self.vault_root)
+        rel_review_path = self.review_dir / f"{base_name}.md"
 
         # Ensure librarian: file in frontmatter
         frontmatter_dict = {"librarian": "file"}
@@ -176,5 +175,5 @@ Based on this conversation, generate a markdown file proposal. Output using the
             body=raw_output,
         )
 
-        self.repo.save_note(rel_review_path, note)
+        rel_review_path = self.repo.create_note(rel_review_path, note)
         return f"Draft saved to {rel_review_path}. Please review in Obsidian."
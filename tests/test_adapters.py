@@ -1,12 +1,16 @@
 """Unit tests for Bubble 2 infrastructure adapters."""
 
+import os
+from datetime import datetime, timezone
 from pathlib import Path
+from unittest.mock import MagicMock, patch
 
 import pytest
 
 from src_v2.core.domain.models import Frontmatter, Note, ValidationResult
 from src_v2.infrastructure.file_system.adapters import ObsidianFileSystemAdapter
 from src_v2.infrastructure.llm.adapters import GeminiAdapter
+from src_v2.infrastructure.llm.cache import CachedLLMProvider
 from src_v2.infrastructure.testing.adapters import MockVaultAdapter
 
 
@@ -32,6 +36,68 @@ class TestObsidianFileSystemAdapter:
         assert loaded.frontmatter.tags == ["tag1"]
         assert loaded.body == "Hello world"
 
+    def test_get_note_reuses_cache_until_file_changes(self, tmp_path: Path) -> None:
+        note_file = tmp_path / "note.md"
+        note_file.write_text("---\ntitle: First\n---\nBody\n", encoding="utf-8")
+        adapter = ObsidianFileSystemAdapter(tmp_path)
+        first = adapter.get_note(Path("note.md"))
+        assert adapter.get_note(Path("note.md")) is first
+        note_file.write_text("---\ntitle: Second version\n---\nBody\n", encoding="utf-8")
+        os.utime(note_file, ns=(0, note_file.stat().st_mtime_ns + 1_000_000))
+        updated = adapter.get_note(Path("note.md"))
+        assert updated is not None
+        assert updated.frontmatter.title == "Second version"
+
+    def test_save_notes_writes_large_batches(self, tmp_path: Path) -> None:
+        adapter = ObsidianFileSystemAdapter(tmp_path)
+        notes = {
+            Path(f"batch/{i}/note.md"): Note(
+                path=Path(f"batch/{i}/note.md"),
+                frontmatter=Frontmatter(title=f"Note {i}"),
+                body=f"Body {i}",
+            )
+            for i in range(12)
+        }
+        adapter.save_notes(notes)
+        for i in range(12):
+            loaded = adapter.get_note(Path(f"batch/{i}/note.md"))
+            assert loaded is not None
+            assert loaded.frontmatter.title == f"Note {i}"
+
+    def test_save_note_recreates_directory_removed_after_first_save(self, tmp_path: Path) -> None:
+        adapter = ObsidianFileSystemAdapter(tmp_path)
+        note = Note(path=Path("dir/a.md"), frontmatter=Frontmatter(title="A"), body="")
+        adapter.save_note(Path("dir/a.md"), note)
+        (tmp_path / "dir" / "a.md").unlink()
+        (tmp_path / "dir").rmdir()
+        adapter.save_note(Path("dir/a.md"), note)
+        assert adapter.get_note(Path("dir/a.md")).frontmatter.title == "A"
+
+    def test_create_note_never_overwrites(self, tmp_path: Path) -> None:
+        adapter = ObsidianFileSystemAdapter(tmp_path)
+        note = Note(path=Path("queue/a.md"), frontmatter=Frontmatter(title="New"), body="")
+        assert adapter.create_note(Path("queue/a.md"), note) == Path("queue/a.md")
+        assert adapter.create_note(Path("queue/a.md"), note) == Path("queue/a-1.md")
+
+        # A name claimed by another writer after it was chosen is skipped, not overwritten.
+        (tmp_path / "queue" / "a-2.md").write_text("other writer", encoding="utf-8")
+        with patch(
+            "src_v2.infrastructure.file_system.adapters.get_safe_path",
+            side_effect=[tmp_path / "queue" / "a-2.md", tmp_path / "queue" / "a-3.md"],
+        ):
+            assert adapter.create_note(Path("queue/a.md"), note) == Path("queue/a-3.md")
+        assert (tmp_path / "queue" / "a-2.md").read_text(encoding="utf-8") == "other writer"
+
+    def test_read_frontmatter_returns_header_metadata(self, tmp_path: Path) -> None:
+        (tmp_path / "proposal.md").write_text(
+            "---\nlibrarian: file\ntarget-file: a.md\n---\n%%FILE: a.md%%\n", encoding="utf-8"
+        )
+        (tmp_path / "plain.md").write_text("Just text\n", encoding="utf-8")
+        adapter = ObsidianFileSystemAdapter(tmp_path)
+        assert adapter.read_frontmatter(Path("proposal.md")) == {"librarian": "file", "target-file": "a.md"}
+        assert adapter.read_frontmatter(Path("plain.md")) == {}
+        assert adapter.read_frontmatter(Path("missing.md")) is None
+
     def test_scan_vault_empty(self, tmp_path: Path) -> None:
         adapter = ObsidianFileSystemAdapter(tmp_path)
         projects = tmp_path / "20. Projects"
@@ -51,6 +117,34 @@ class TestObsidianFileSystemAdapter:
         assert results[0].score == 10
         assert "Missing aliases/tags" in results[0].reasons
 
+    def test_scan_vault_reads_frontmatter_only(self, tmp_path: Path) -> None:
+        project = tmp_path / "20. Projects" / "Alpha"
+        project.mkdir(parents=True)
+        (project / "Overview.md").write_text("---\ncode: ALP\ntags: [a]\n---\n", encoding="utf-8")
+        (project / "Plan.md").write_text("---\ntags: [a]\n---\nBody\n---\nx: [unclosed\n", encoding="utf-8")
+        adapter = ObsidianFileSystemAdapter(tmp_path)
+        with patch("src_v2.infrastructure.file_system.adapters.load_post", side_effect=AssertionError):
+            results = adapter.scan_vault()
+        assert sorted((str(r.path), r.score) for r in results) == [
+            ("20. Projects/Alpha/Overview.md", 50),
+            ("20. Projects/Alpha/Plan.md", 50),
+        ]
+
+    def test_scan_vault_sees_code_changes_between_scans(self, tmp_path: Path) -> None:
+        project = tmp_path / "20. Projects" / "Alpha"
+        (project / "Notes").mkdir(parents=True)
+        (project / "Notes" / "Plan.md").write_text("---\ntags: [a]\n---\n", encoding="utf-8")
+        adapter = ObsidianFileSystemAdapter(tmp_path)
+        assert adapter.scan_vault() == []
+
+        (project / "Overview.md").write_text("---\ncode: ALP\ntags: [a]\n---\n", encoding="utf-8")
+        results = adapter.scan_vault()
+        assert sorted(str(r.path) for r in results) == [
+            "20. Projects/Alpha/Notes/Plan.md",
+            "20. Projects/Alpha/Overview.md",
+        ]
+        assert all(r.reasons == ["Missing Project Code: ALP"] for r in results)
+
     def test_scan_vault_identifies_generic_filename(self, tmp_path: Path) -> None:
         projects = tmp_path / "20. Projects" / "Foo"
         projects.mkdir(parents=True)
@@ -64,6 +158,241 @@ class TestObsidianFileSystemAdapter:
         assert results[0].score == 20
         assert "Generic Filename" in results[0].reasons
 
+    def test_get_code_registry_entries_from_areas_and_projects(self, tmp_path: Path) -> None:
+        for folder, code in (("20. Projects/Alpha", "ALPH"), ("30. Areas/Health", "HLTH")):
+            (tmp_path / folder).mkdir(parents=True)
+            (tmp_path / folder / "index.md").write_text(
+                f"---\ncode: {code}\ntype: project\n---\n", encoding="utf-8"
+            )
+        (tmp_path / "20. Projects/Alpha/plain.md").write_text("No frontmatter\n", encoding="utf-8")
+        adapter = ObsidianFileSystemAdapter(tmp_path)
+        entries = sorted(adapter.get_code_registry_entries(), key=lambda e: e.code)
+        assert [(e.code, e.folder) for e in entries] == [
+            ("ALPH", "20. Projects/Alpha"),
+            ("HLTH", "30. Areas/Health"),
+        ]
+        assert entries[0].type == "project"
+
+    def test_code_registry_lists_areas_before_projects(self, tmp_path: Path) -> None:
+        for folder, code in (("20. Projects/Alpha", "SAME"), ("30. Areas/Health", "SAME")):
+            (tmp_path / folder).mkdir(parents=True)
+            (tmp_path / folder / "index.md").write_text(f"---\ncode: {code}\n---\n", encoding="utf-8")
+        adapter = ObsidianFileSystemAdapter(tmp_path)
+        assert [e.folder for e in adapter.get_code_registry_entries()] == ["30. Areas/Health", "20. Projects/Alpha"]
+
+    def test_scan_vault_lists_projects_before_areas(self, tmp_path: Path) -> None:
+        for folder in ("20. Projects/Alpha", "30. Areas/Health"):
+            (tmp_path / folder).mkdir(parents=True)
+            (tmp_path / folder / "untitled.md").write_text("---\ntags: [a]\n---\n", encoding="utf-8")
+        adapter = ObsidianFileSystemAdapter(tmp_path)
+        assert [str(r.path.parent) for r in adapter.scan_vault()] == ["20. Projects/Alpha", "30. Areas/Health"]
+
+    def test_code_index_reparses_only_changed_notes(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        from src_v2.infrastructure.file_system import adapters as fs_adapters
+
+        project = tmp_path / "20. Projects" / "Alpha"
+        project.mkdir(parents=True)
+        (project / "index.md").write_text("---\ncode: ALPH\n---\n", encoding="utf-8")
+        (project / "other.md").write_text("---\ntags: [x]\n---\n", encoding="utf-8")
+        parsed: list[str] = []
+        original_load = fs_adapters._load_metadata
+
+        def counting_load(file_path):
+            parsed.append(os.path.basename(file_path))
+            return original_load(file_path)
+
+        monkeypatch.setattr(fs_adapters, "_load_metadata", counting_load)
+        adapter = ObsidianFileSystemAdapter(tmp_path)
+        assert [e.code for e in adapter.get_code_registry_entries()] == ["ALPH"]
+        adapter.scan_vault()
+        assert sorted(parsed) == ["index.md", "other.md"]
+
+        index = project / "index.md"
+        index.write_text("---\ncode: BETA\n---\n", encoding="utf-8")
+        os.utime(index, ns=(0, index.stat().st_mtime_ns + 1_000_000))
+        assert [e.code for e in adapter.get_code_registry_entries()] == ["BETA"]
+        assert sorted(parsed) == ["index.md", "index.md", "other.md"]
+
+    def test_code_scan_ignores_notes_without_frontmatter(self, tmp_path: Path) -> None:
+        project = tmp_path / "20. Projects" / "Alpha"
+        project.mkdir(parents=True)
+        (project / "plain.md").write_text("Intro\n---\ncode: NOPE\n---\n", encoding="utf-8")
+        (project / "index.md").write_text("\n---\ncode: ALPH\n---\nBody\n", encoding="utf-8")
+        adapter = ObsidianFileSystemAdapter(tmp_path)
+        assert [e.code for e in adapter.get_code_registry_entries()] == ["ALPH"]
+
+    def test_code_scan_reads_only_the_frontmatter_block(self, tmp_path: Path) -> None:
+        project = tmp_path / "20. Projects" / "Alpha"
+        project.mkdir(parents=True)
+        (project / "index.md").write_text(
+            "---\ncode: ALPH\ntype: project\n---\nBody\n---\ncode: [unclosed\n", encoding="utf-8"
+        )
+        (project / "open.md").write_text("---\ncode: OPEN\nNo closing fence\n", encoding="utf-8")
+        adapter = ObsidianFileSystemAdapter(tmp_path)
+        entries = adapter.get_code_registry_entries()
+        assert [(e.code, e.type) for e in entries] == [("ALPH", "project")]
+
+    def test_code_scan_finds_fences_across_read_chunks(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        from src_v2.infrastructure.file_system import adapters as fs_adapters
+
+        monkeypatch.setattr(fs_adapters, "FENCE_SCAN_CHUNK", 3)
+        project = tmp_path / "20. Projects" / "Alpha"
+        project.mkdir(parents=True)
+        (project / "index.md").write_text(
+            "\n  ---\r\ncode: ALPH\r\nnote: a --- b\r\n-----  \r\nBody\n", encoding="utf-8"
+        )
+        adapter = ObsidianFileSystemAdapter(tmp_path)
+        assert [e.code for e in adapter.get_code_registry_entries()] == ["ALPH"]
+
+    def test_code_scan_parallel_path_matches_serial(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        from src_v2.infrastructure.file_system import adapters as fs_adapters
+
+        project = tmp_path / "20. Projects" / "Alpha"
+        project.mkdir(parents=True)
+        for i in range(5):
+            (project / f"n{i}.md").write_text(f"---\ncode: C{i}\n---\n", encoding="utf-8")
+        adapter = ObsidianFileSystemAdapter(tmp_path)
+        serial = adapter.get_code_registry_entries()
+        monkeypatch.setattr(fs_adapters, "PARALLEL_SCAN_THRESHOLD", 0)
+        assert adapter.get_code_registry_entries() == serial
+
+    def test_cache_invalidation_waits_for_running_scan(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A write from another thread does not touch the metadata cache while a scan is using it."""
+        import threading
+
+        from src_v2.infrastructure.file_system import adapters as fs_adapters
+
+        project = tmp_path / "20. Projects" / "Alpha"
+        project.mkdir(parents=True)
+        (project / "Overview.md").write_text("---\ncode: ALP\n---\n", encoding="utf-8")
+        adapter = ObsidianFileSystemAdapter(tmp_path)
+        entered, release = threading.Event(), threading.Event()
+        original_load = fs_adapters._load_all_metadata
+
+        def blocking_load(paths: list[str]) -> list[dict | None]:
+            entered.set()
+            release.wait(5)
+            return original_load(paths)
+
+        monkeypatch.setattr(fs_adapters, "_load_all_metadata", blocking_load)
+        scan = threading.Thread(target=adapter.get_code_registry_entries)
+        scan.start()
+        assert entered.wait(5)
+        write = threading.Thread(
+            target=adapter.save_note,
+            args=(Path("20. Projects/Alpha/New.md"), Note(path=Path("New.md"), frontmatter=Frontmatter())),
+        )
+        write.start()
+        write.join(0.2)
+        assert write.is_alive()
+        release.set()
+        scan.join(5)
+        write.join(5)
+        assert not write.is_alive()
+
+    def test_scan_vault_skips_excluded_subdirectories(self, tmp_path: Path) -> None:
+        trash = tmp_path / "20. Projects" / "Foo" / ".trash"
+        trash.mkdir(parents=True)
+        (trash / "meeting.md").write_text("---\n---\nDeleted\n", encoding="utf-8")
+        adapter = ObsidianFileSystemAdapter(tmp_path)
+        assert adapter.scan_vault() == []
+
+    def test_folders_inside_excluded_directories_are_not_scanned(self, tmp_path: Path) -> None:
+        projects = tmp_path / "99. System" / "Projects"
+        projects.mkdir(parents=True)
+        (projects / "meeting.md").write_text("---\ncode: SYS\n---\n", encoding="utf-8")
+        adapter = ObsidianFileSystemAdapter(tmp_path, projects_folder="99. System/Projects")
+        assert adapter.get_code_registry_entries() == []
+        assert adapter.scan_vault() == []
+
+    def test_get_skeleton_lists_titles_paths_and_aliases(self, tmp_path: Path) -> None:
+        area = tmp_path / "30. Areas" / "Health"
+        area.mkdir(parents=True)
+        (area / "Running.md").write_text("---\naliases: [Jogging]\n---\nBody\n", encoding="utf-8")
+        adapter = ObsidianFileSystemAdapter(tmp_path)
+        assert adapter.get_skeleton() == (
+            "- [[Running]] (30. Areas/Health/Running.md) [Aliases: Jogging]"
+        )
+
+    def test_get_skeleton_ignores_note_bodies(self, tmp_path: Path) -> None:
+        area = tmp_path / "30. Areas" / "Health"
+        area.mkdir(parents=True)
+        (area / "Sleep.md").write_text(
+            "---\ntitle: Rest\n---\nBody\n---\ntitle: [unclosed\n", encoding="utf-8"
+        )
+        (area / "Broken.md").write_text("---\ntitle: [unclosed\n---\n", encoding="utf-8")
+        adapter = ObsidianFileSystemAdapter(tmp_path)
+        assert adapter.get_skeleton() == "- [[Rest]] (30. Areas/Health/Sleep.md)"
+
+    def test_get_skeleton_parallel_path_matches_serial(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        from src_v2.infrastructure.file_system import adapters as fs_adapters
+
+        area = tmp_path / "30. Areas" / "Health"
+        area.mkdir(parents=True)
+        for i in range(5):
+            (area / f"n{i}.md").write_text(f"---\ntitle: T{i}\naliases: [A{i}]\n---\n", encoding="utf-8")
+        serial = ObsidianFileSystemAdapter(tmp_path).get_skeleton()
+        monkeypatch.setattr(fs_adapters, "PARALLEL_SCAN_THRESHOLD", 0)
+        assert ObsidianFileSystemAdapter(tmp_path).get_skeleton() == serial
+
+    def test_get_skeleton_reparses_only_changed_notes(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        from src_v2.infrastructure.file_system import adapters as fs_adapters
+
+        project = tmp_path / "20. Projects" / "Alpha"
+        project.mkdir(parents=True)
+        (project / "index.md").write_text("---\ncode: ALPH\n---\n", encoding="utf-8")
+        resource = tmp_path / "40. Resources"
+        resource.mkdir()
+        (resource / "Ref.md").write_text("---\ntitle: Ref\n---\n", encoding="utf-8")
+        parsed: list[str] = []
+        original_load = fs_adapters._load_metadata
+
+        def counting_load(file_path):
+            parsed.append(os.path.basename(file_path))
+            return original_load(file_path)
+
+        monkeypatch.setattr(fs_adapters, "_load_metadata", counting_load)
+        adapter = ObsidianFileSystemAdapter(tmp_path)
+        adapter.get_code_registry_entries()
+        first = adapter.get_skeleton()
+        assert adapter.get_skeleton() == first
+        assert sorted(parsed) == ["Ref.md", "index.md"]
+
+        ref = resource / "Ref.md"
+        ref.write_text("---\ntitle: Reference\n---\n", encoding="utf-8")
+        os.utime(ref, ns=(0, ref.stat().st_mtime_ns + 1_000_000))
+        assert "[[Reference]]" in adapter.get_skeleton()
+        assert sorted(parsed) == ["Ref.md", "Ref.md", "index.md"]
+
+    def test_read_raw_returns_text_with_universal_newlines(self, tmp_path: Path) -> None:
+        (tmp_path / "a.md").write_bytes("---\r\ntitle: Ä\r\n---\r\nBody\r\n".encode())
+        (tmp_path / "folder.md").mkdir()
+        adapter = ObsidianFileSystemAdapter(tmp_path)
+        assert adapter.read_raw(Path("a.md")) == "---\ntitle: Ä\n---\nBody\n"
+        assert adapter.read_raw(Path("missing.md")) is None
+        assert adapter.read_raw(Path("folder.md")) is None
+
+    def test_list_note_paths_in_lists_direct_markdown_files(self, tmp_path: Path) -> None:
+        queue = tmp_path / "00. Inbox" / "1. Review Queue"
+        (queue / "nested.md").mkdir(parents=True)
+        (queue / "b.md").write_text("", encoding="utf-8")
+        (queue / "a.md").write_text("", encoding="utf-8")
+        (queue / "image.png").write_bytes(b"")
+        adapter = ObsidianFileSystemAdapter(tmp_path)
+        rel_queue = Path("00. Inbox/1. Review Queue")
+        assert adapter.list_note_paths_in(rel_queue) == [rel_queue / "a.md", rel_queue / "b.md"]
+        assert adapter.list_note_paths_in(Path("missing")) == []
+
     def test_validate_note_distinct_from_file_walking(self, tmp_path: Path) -> None:
         """_validate_note is a separate helper; verify it evaluates rules correctly."""
         projects = tmp_path / "20. Projects" / "Foo"
@@ -142,3 +471,210 @@ class TestGeminiAdapter:
         monkeypatch.delenv("GEMINI_API_KEY", raising=False)
         with pytest.raises(ValueError, match="GEMINI_API_KEY"):
             GeminiAdapter()
+
+    def test_generate_proposal_reuses_model_and_config(self) -> None:
+        mock_model_cls = MagicMock()
+        mock_model_cls.return_value.generate_content.return_value.text = "%%FILE: a.md%%"
+        with (
+            patch("src_v2.infrastructure.llm.adapters.genai.configure"),
+            patch("src_v2.infrastructure.llm.adapters.genai.GenerativeModel", mock_model_cls),
+        ):
+            adapter = GeminiAdapter(api_key="test-key")
+            for body in ("one", "two"):
+                assert adapter.generate_proposal("Fix", body, "ctx", "") == "%%FILE: a.md%%"
+        assert mock_model_cls.call_count == 1
+        configs = [c.kwargs["generation_config"] for c in mock_model_cls.return_value.generate_content.call_args_list]
+        assert configs[0] is configs[1]
+
+    def test_repeated_transient_failures_open_circuit(self) -> None:
+        from google.api_core import exceptions as api_exceptions
+
+        mock_model_cls = MagicMock()
+        generate = mock_model_cls.return_value.generate_content
+        generate.side_effect = api_exceptions.ResourceExhausted("quota")
+        with (
+            patch("src_v2.infrastructure.llm.adapters.genai.configure"),
+            patch("src_v2.infrastructure.llm.adapters.genai.GenerativeModel", mock_model_cls),
+        ):
+            adapter = GeminiAdapter(api_key="test-key")
+            for _ in range(3):
+                with pytest.raises(api_exceptions.ResourceExhausted):
+                    adapter.generate_text("hi")
+            with pytest.raises(api_exceptions.ServiceUnavailable):
+                adapter.generate_text("hi")
+        assert generate.call_count == 3
+        assert "retry" in generate.call_args.kwargs["request_options"]
+
+    def test_output_cap_scales_with_note_and_retries_when_hit(self) -> None:
+        mock_model_cls = MagicMock()
+        generate = mock_model_cls.return_value.generate_content
+        truncated = MagicMock(text="%%FILE: a.md%%\npartial", candidates=[MagicMock(finish_reason="MAX_TOKENS")])
+        generate.side_effect = [truncated, MagicMock(text="%%FILE: a.md%%\nfull")]
+        with (
+            patch("src_v2.infrastructure.llm.adapters.genai.configure"),
+            patch("src_v2.infrastructure.llm.adapters.genai.GenerativeModel", mock_model_cls),
+        ):
+            adapter = GeminiAdapter(api_key="test-key")
+            assert adapter.generate_proposal("Fix", "short note", "ctx", "") == "%%FILE: a.md%%\nfull"
+        caps = [c.kwargs["generation_config"].max_output_tokens for c in generate.call_args_list]
+        assert caps == [2048, 8192]
+
+    def test_context_cache_reused_until_context_changes(self) -> None:
+        mock_model_cls = MagicMock()
+        cached_model = mock_model_cls.from_cached_content.return_value
+        cached_model.generate_content.return_value.text = "%%FILE: a.md%%"
+        context = "x" * 10000
+        with (
+            patch("src_v2.infrastructure.llm.adapters.genai.configure"),
+            patch("src_v2.infrastructure.llm.adapters.genai.GenerativeModel", mock_model_cls),
+            patch("src_v2.infrastructure.llm.adapters.genai.caching.CachedContent.create") as create,
+        ):
+            create.return_value.expire_time = datetime.now(timezone.utc).replace(year=2100)
+            adapter = GeminiAdapter(api_key="test-key", context_cache_ttl=3600)
+            adapter.generate_proposal("Fix", "one", context, "")
+            adapter.generate_proposal("Fix", "two", context, "")
+            adapter.generate_proposal("Fix", "three", context + "y", "")
+        assert create.call_count == 2
+        create.return_value.delete.assert_called_once()
+        prompt = cached_model.generate_content.call_args.args[0]
+        assert "three" in prompt and "VAULT CONTEXT" not in prompt
+
+    def test_context_cache_rebuilt_before_it_expires(self) -> None:
+        mock_model_cls = MagicMock()
+        mock_model_cls.from_cached_content.return_value.generate_content.return_value.text = "%%FILE: a.md%%"
+        context = "x" * 10000
+        with (
+            patch("src_v2.infrastructure.llm.adapters.genai.configure"),
+            patch("src_v2.infrastructure.llm.adapters.genai.GenerativeModel", mock_model_cls),
+            patch("src_v2.infrastructure.llm.adapters.genai.caching.CachedContent.create") as create,
+        ):
+            create.return_value.expire_time = datetime.fromtimestamp(5000.0, timezone.utc)
+            adapter = GeminiAdapter(api_key="test-key", context_cache_ttl=3600)
+            with patch("src_v2.infrastructure.llm.adapters.time.time", return_value=1400.0):
+                adapter.generate_proposal("Fix", "one", context, "")
+            with patch("src_v2.infrastructure.llm.adapters.time.time", return_value=4900.0):
+                adapter.generate_proposal("Fix", "two", context, "")
+            with patch("src_v2.infrastructure.llm.adapters.time.time", return_value=4950.0):
+                adapter.generate_proposal("Fix", "three", context, "")
+        assert create.call_count == 2
+        create.return_value.delete.assert_called_once()
+
+    def test_expired_context_cache_falls_back_to_inline_context(self) -> None:
+        from google.api_core import exceptions as api_exceptions
+
+        mock_model_cls = MagicMock()
+        cached_generate = mock_model_cls.from_cached_content.return_value.generate_content
+        cached_generate.side_effect = api_exceptions.NotFound("CachedContent not found")
+        inline_generate = mock_model_cls.return_value.generate_content
+        inline_generate.return_value.text = "%%FILE: a.md%%"
+        context = "x" * 10000
+        with (
+            patch("src_v2.infrastructure.llm.adapters.genai.configure"),
+            patch("src_v2.infrastructure.llm.adapters.genai.GenerativeModel", mock_model_cls),
+            patch("src_v2.infrastructure.llm.adapters.genai.caching.CachedContent.create") as create,
+        ):
+            create.return_value.expire_time = datetime.now(timezone.utc).replace(year=2100)
+            adapter = GeminiAdapter(api_key="test-key", context_cache_ttl=3600)
+            assert adapter.generate_proposal("Fix", "one", context, "") == "%%FILE: a.md%%"
+            assert "VAULT CONTEXT" in inline_generate.call_args.args[0]
+            adapter.generate_proposal("Fix", "two", context, "")
+        assert create.call_count == 2
+        create.return_value.delete.assert_not_called()
+
+    def test_failed_context_cache_creation_is_logged_and_retried(self, caplog: pytest.LogCaptureFixture) -> None:
+        mock_model_cls = MagicMock()
+        inline_generate = mock_model_cls.return_value.generate_content
+        inline_generate.return_value.text = "%%FILE: a.md%%"
+        context = "x" * 10000
+        with (
+            patch("src_v2.infrastructure.llm.adapters.genai.configure"),
+            patch("src_v2.infrastructure.llm.adapters.genai.GenerativeModel", mock_model_cls),
+            patch("src_v2.infrastructure.llm.adapters.genai.caching.CachedContent.create") as create,
+        ):
+            create.side_effect = RuntimeError("too few tokens")
+            adapter = GeminiAdapter(api_key="test-key", context_cache_ttl=3600)
+            with patch("src_v2.infrastructure.llm.adapters.time.time", return_value=1000.0):
+                adapter.generate_proposal("Fix", "one", context, "")
+                adapter.generate_proposal("Fix", "two", context, "")
+            with patch("src_v2.infrastructure.llm.adapters.time.time", return_value=2000.0):
+                adapter.generate_proposal("Fix", "three", context, "")
+        assert create.call_count == 2
+        assert "too few tokens" in caplog.text
+        assert "VAULT CONTEXT" in inline_generate.call_args.args[0]
+
+    def test_generate_proposals_retries_items_missing_from_batch(self) -> None:
+        mock_model_cls = MagicMock()
+        generate = mock_model_cls.return_value.generate_content
+        batch = MagicMock(text="%%BATCH_ITEM: 1%%\n%%FILE: a.md%%\n", candidates=[])
+        generate.side_effect = [batch, MagicMock(text="%%FILE: b.md%%")]
+        with (
+            patch("src_v2.infrastructure.llm.adapters.genai.configure"),
+            patch("src_v2.infrastructure.llm.adapters.genai.GenerativeModel", mock_model_cls),
+        ):
+            adapter = GeminiAdapter(api_key="test-key")
+            results = adapter.generate_proposals([("Fix", "one"), ("Fix", "two")], "ctx", "")
+        assert results == ["%%FILE: a.md%%", "%%FILE: b.md%%"]
+        assert generate.call_count == 2
+        assert "=== NOTE 2 ===" in generate.call_args_list[0].args[0]
+
+
+class TestCachedLLMProvider:
+    """Tests for CachedLLMProvider."""
+
+    def test_identical_requests_are_served_from_cache(self, tmp_path: Path) -> None:
+        inner = MagicMock()
+        inner.cache_namespace = "model:abc"
+        inner.generate_proposal.side_effect = ["first", "second"]
+        llm = CachedLLMProvider(inner, tmp_path / "cache" / "llm.sqlite3")
+        assert llm.generate_proposal("Fix", "body", "ctx", "") == "first"
+        assert llm.generate_proposal("Fix", "body", "ctx", "") == "first"
+        assert llm.generate_proposal("Fix", "other body", "ctx", "") == "second"
+        assert inner.generate_proposal.call_count == 2
+
+    def test_cache_persists_and_is_scoped_by_namespace(self, tmp_path: Path) -> None:
+        db_path = tmp_path / "llm.sqlite3"
+        inner = MagicMock()
+        inner.generate_text.return_value = "stored"
+        first = CachedLLMProvider(inner, db_path, namespace="v1")
+        assert first.generate_text("hello") == "stored"
+        first.close()
+
+        inner.generate_text.return_value = "fresh"
+        assert CachedLLMProvider(inner, db_path, namespace="v1").generate_text("hello") == "stored"
+        assert CachedLLMProvider(inner, db_path, namespace="v2").generate_text("hello") == "fresh"
+
+    def test_line_ending_differences_share_a_cache_entry(self, tmp_path: Path) -> None:
+        inner = MagicMock()
+        inner.generate_proposal.return_value = "proposal"
+        llm = CachedLLMProvider(inner, tmp_path / "llm.sqlite3", namespace="v1")
+        llm.generate_proposal("Fix", "Line one\nLine two\n", "ctx", "")
+        llm.generate_proposal("Fix", "Line one\r\nLine two\r\n", "ctx", "")
+        assert inner.generate_proposal.call_count == 1
+        llm.generate_proposal("Fix", "Line one\n  Line two\n", "ctx", "")
+        assert inner.generate_proposal.call_count == 2
+
+    def test_markdown_hard_line_breaks_get_their_own_key(self, tmp_path: Path) -> None:
+        llm = CachedLLMProvider(MagicMock(), tmp_path / "llm.sqlite3", namespace="v1")
+        assert llm._cache_key("generate_text", prompt="a  \nb") != llm._cache_key("generate_text", prompt="a\nb")
+
+    def test_entries_older_than_max_age_are_refreshed(self, tmp_path: Path) -> None:
+        inner = MagicMock()
+        inner.generate_text.side_effect = ["old", "new"]
+        llm = CachedLLMProvider(inner, tmp_path / "llm.sqlite3", namespace="v1", max_age=60)
+        with patch("src_v2.infrastructure.llm.cache.time.time", return_value=1000.0):
+            assert llm.generate_text("hello") == "old"
+        with patch("src_v2.infrastructure.llm.cache.time.time", return_value=1030.0):
+            assert llm.generate_text("hello") == "old"
+        with patch("src_v2.infrastructure.llm.cache.time.time", return_value=1100.0):
+            assert llm.generate_text("hello") == "new"
+        assert inner.generate_text.call_count == 2
+
+    def test_batch_sends_only_uncached_items(self, tmp_path: Path) -> None:
+        inner = MagicMock()
+        inner.generate_proposal.return_value = "cached"
+        inner.generate_proposals.return_value = ["new"]
+        llm = CachedLLMProvider(inner, tmp_path / "llm.sqlite3", namespace="v1")
+        llm.generate_proposal("Fix", "seen", "ctx", "")
+        assert llm.generate_proposals([("Fix", "seen"), ("Fix", "unseen")], "ctx", "") == ["cached", "new"]
+        inner.generate_proposals.assert_called_once_with([("Fix", "unseen")], "ctx", "")
+        assert llm.generate_proposal("Fix", "unseen", "ctx", "") == "new"
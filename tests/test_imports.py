@@ -17,3 +17,36 @@ def test_ports_import():
 
     assert VaultRepository is not None
     assert LLMProvider is not None
+
+
+def test_file_system_adapter_does_not_import_gemini_sdk():
+    """Importing the vault adapter must not pull in the Gemini SDK."""
+    import subprocess
+    import sys
+    from pathlib import Path
+
+    code = (
+        "import sys\n"
+        "import src_v2.infrastructure.file_system.adapters\n"
+        "import src_v2.infrastructure.llm.cache\n"
+        "import src_v2.entrypoints.cli\n"
+        "assert 'google.generativeai' not in sys.modules\n"
+        "from src_v2.infrastructure import GeminiAdapter\n"
+        "assert 'google.generativeai' in sys.modules\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True, cwd=Path(__file__).parents[1])
+
+
+def test_services_do_not_import_frontmatter_at_module_scope():
+    """python-frontmatter (and PyYAML) load on first parse, not on import."""
+    import subprocess
+    import sys
+    from pathlib import Path
+
+    code = (
+        "import sys\n"
+        "import src_v2.use_cases.ingestion_service\n"
+        "import src_v2.infrastructure.file_system.adapters\n"
+        "assert 'frontmatter' not in sys.modules\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True, cwd=Path(__file__).parents[1])
@@ -46,6 +46,20 @@ class TestAssistantService:
         assert "[[Pepsi Project]]" in result
         assert "20. Projects/Pepsi/Pepsi Project.md" in result
 
+    def test_get_full_context_caps_skeleton_at_line_boundary(
+        self, populated_vault: MockVaultAdapter, fake_llm: FakeLLM
+    ) -> None:
+        populated_vault.set_skeleton("- [[A]] (a.md)\n- [[B]] (b.md)\n- [[C]] (c.md)")
+        config = ContextConfig(
+            system_instructions_path="nonexistent.md",
+            tag_glossary_path="nonexistent.md",
+            max_skeleton_chars=20,
+        )
+        service = AssistantService(populated_vault, fake_llm, config)
+        result = service.get_full_context()
+        assert "- [[A]] (a.md)\n- ... (2 more notes omitted)\n" in result
+        assert "[[B]]" not in result
+
     def test_generate_blueprint_returns_proposal(
         self, populated_vault: MockVaultAdapter, fake_llm: FakeLLM
     ) -> None:
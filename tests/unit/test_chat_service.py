@@ -147,3 +147,20 @@ class TestChatServiceTools:
 
         assert result == "Here are the files."
         mock_chat.send_message.assert_called_once()
+
+    def test_chat_reuses_model_per_area(self, service: ChatService) -> None:
+        """chat() builds one model per active area and reuses it on later turns."""
+        mock_response = MagicMock()
+        mock_response.candidates = [
+            MagicMock(content=MagicMock(parts=[MagicMock(text="ok", function_call=None)]))
+        ]
+        mock_model = MagicMock()
+        mock_model.return_value = mock_model
+        mock_model.start_chat.return_value.send_message.return_value = mock_response
+
+        with patch("src_v2.use_cases.chat_service.genai.GenerativeModel", mock_model):
+            service.chat("first", "20. Projects")
+            service.chat("second", "20. Projects")
+            service.chat("third", "30. Areas")
+
+        assert mock_model.call_count == 2
@@ -22,6 +22,17 @@ Body content.
 """
 
 
+def _make_offenders(vault_root: Path, count: int) -> list[ValidationResult]:
+    """Create count offender notes under vault_root and return their audit results."""
+    offenders = []
+    for i in range(count):
+        path = Path(f"20. Projects/Pepsi/file_{i}.md")
+        (vault_root / path).parent.mkdir(parents=True, exist_ok=True)
+        (vault_root / path).write_text("", encoding="utf-8")
+        offenders.append(ValidationResult(path=path, score=10, reasons=["Missing tags"]))
+    return offenders
+
+
 class TestCronRunnerFixLoop:
     """Tests for the Night Watchman fix loop in cron_runner.main()."""
 
@@ -33,6 +44,9 @@ class TestCronRunnerFixLoop:
         mock_settings.return_value.vault_root = tmp_path
         mock_settings.return_value.gemini_api_key = "test-key"
         mock_settings.return_value.log_level = "INFO"
+        mock_settings.return_value.llm_cache_path = ""
+        mock_settings.return_value.llm_cache_ttl = 0
+        mock_settings.return_value.llm_context_cache_ttl = 0
         mock_settings.return_value.registry_output_path = "99. System/Registry.md"
         mock_repo = MagicMock()
         mock_repo.save_note = MagicMock()
@@ -43,16 +57,20 @@ class TestCronRunnerFixLoop:
             patch("src_v2.entrypoints.cron_runner.Settings", mock_settings),
             patch("src_v2.entrypoints.cron_runner.GeminiAdapter"),
             patch("src_v2.entrypoints.cron_runner.ObsidianFileSystemAdapter") as mock_adapter_cls,
+            patch("src_v2.entrypoints.cron_runner.AssistantService") as mock_assistant_cls,
         ):
             mock_adapter_cls.return_value = mock_repo
-            yield {"adapter": mock_adapter_cls, "repo": mock_repo}
+            mock_assistant_cls.return_value.get_full_context.return_value = "CONTEXT"
+            yield {
+                "adapter": mock_adapter_cls,
+                "repo": mock_repo,
+                "assistant": mock_assistant_cls.return_value,
+                "vault_root": tmp_path,
+            }
 
     def test_limit_fix_loop_executes_exactly_10_times(self, _patch_dependencies):
         """If audit_vault returns 15 offenders, fix_file is called exactly 10 times."""
-        fifteen_offenders = [
-            ValidationResult(path=Path(f"20. Projects/Pepsi/file_{i}.md"), score=10, reasons=["Missing tags"])
-            for i in range(15)
-        ]
+        fifteen_offenders = _make_offenders(_patch_dependencies["vault_root"], 15)
 
         with patch("src_v2.entrypoints.cron_runner.MaintenanceService") as MockMaint:
             mock_maint = MagicMock()
@@ -70,17 +88,10 @@ class TestCronRunnerFixLoop:
     def test_fault_tolerance_continues_after_fix_file_exception(self, _patch_dependencies):
         """If fix_file raises on one file, loop continues and runner exits 0."""
         mock_repo = _patch_dependencies["repo"]
-        ten_offenders = [
-            ValidationResult(path=Path(f"20. Projects/Pepsi/file_{i}.md"), score=10, reasons=["Missing tags"])
-            for i in range(10)
-        ]
-
-        call_count = 0
+        ten_offenders = _make_offenders(_patch_dependencies["vault_root"], 10)
 
-        def fix_file_side_effect(path):
-            nonlocal call_count
-            call_count += 1
-            if call_count == 3:
+        def fix_file_side_effect(path, context=None):
+            if path.name == "file_2.md":
                 raise ValueError("Bad LLM response")
             return _valid_proposal(str(path))
 
@@ -108,3 +119,60 @@ class TestCronRunnerFixLoop:
 
         assert result == 0
         mock_maint.fix_file.assert_not_called()
+
+    def test_fixes_applied_in_audit_order(self, _patch_dependencies):
+        """Fix requests run concurrently but are saved in audit order."""
+        import time
+
+        mock_repo = _patch_dependencies["repo"]
+        offenders = _make_offenders(_patch_dependencies["vault_root"], 5)
+
+        def fix_file_side_effect(path, context=None):
+            time.sleep(0.01 * (5 - int(path.stem.split("_")[1])))
+            return _valid_proposal(str(path))
+
+        with patch("src_v2.entrypoints.cron_runner.MaintenanceService") as MockMaint:
+            mock_maint = MagicMock()
+            MockMaint.return_value = mock_maint
+            mock_maint.audit_vault.return_value = offenders
+            mock_maint.fix_file.side_effect = fix_file_side_effect
+
+            result = main()
+
+        assert result == 0
+        saved = [c.args[0] for c in mock_repo.save_note.call_args_list[1:]]
+        assert saved == [r.path for r in offenders]
+
+    def test_offenders_missing_on_disk_are_skipped(self, _patch_dependencies):
+        """Offenders deleted since the audit are dropped; the next ones fill the budget."""
+        offenders = _make_offenders(_patch_dependencies["vault_root"], 12)
+        (_patch_dependencies["vault_root"] / offenders[0].path).unlink()
+
+        with patch("src_v2.entrypoints.cron_runner.MaintenanceService") as MockMaint:
+            mock_maint = MagicMock()
+            MockMaint.return_value = mock_maint
+            mock_maint.audit_vault.return_value = offenders
+            mock_maint.fix_file.side_effect = lambda path, context=None: _valid_proposal(str(path))
+
+            result = main()
+
+        assert result == 0
+        fixed = sorted(c.args[0].name for c in mock_maint.fix_file.call_args_list)
+        assert fixed == sorted(f"file_{i}.md" for i in range(1, 11))
+
+    def test_context_built_once_per_run(self, _patch_dependencies):
+        """The vault context is built once and shared by every fix request."""
+        assistant = _patch_dependencies["assistant"]
+        offenders = _make_offenders(_patch_dependencies["vault_root"], 3)
+
+        with patch("src_v2.entrypoints.cron_runner.MaintenanceService") as MockMaint:
+            mock_maint = MagicMock()
+            MockMaint.return_value = mock_maint
+            mock_maint.audit_vault.return_value = offenders
+            mock_maint.fix_file.side_effect = lambda path, context=None: _valid_proposal(str(path))
+
+            result = main()
+
+        assert result == 0
+        assistant.get_full_context.assert_called_once()
+        assert all(c.kwargs["context"] == "CONTEXT" for c in mock_maint.fix_file.call_args_list)
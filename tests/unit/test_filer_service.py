@@ -72,6 +72,90 @@ Body content here."""
         assert filed_note.frontmatter.model_dump().get("title") == "Bar Note"
         assert "Body content here" in filed_note.body
 
+    def test_duplicate_paths_in_one_proposal_get_suffixes(self) -> None:
+        review_dir = Path("00. Inbox/1. Review Queue")
+        prop_path = review_dir / "proposal.md"
+        prop_body = """%%FILE: 20. Projects/Foo/bar.md%%
+---
+title: First
+---
+One.
+%%FILE: 20. Projects/Foo/bar.md%%
+---
+title: Second
+---
+Two."""
+        repo = MockVaultAdapter()
+        repo.add_note(
+            prop_path,
+            Note(
+                path=prop_path,
+                frontmatter=Frontmatter.model_validate({"librarian": "file"}),
+                body=prop_body,
+            ),
+        )
+
+        service = FilerService(
+            repo,
+            review_dir=str(review_dir),
+            vault_root=Path("/vault"),
+        )
+
+        assert service.file_approved_notes() == 2
+        assert repo.get_note(Path("20. Projects/Foo/bar.md")).frontmatter.title == "First"
+        assert repo.get_note(Path("20. Projects/Foo/bar-1.md")).frontmatter.title == "Second"
+
+    def test_same_path_across_proposals_gets_suffix(self) -> None:
+        review_dir = Path("00. Inbox/1. Review Queue")
+        repo = MockVaultAdapter()
+        for i, title in enumerate(("First", "Second")):
+            prop_path = review_dir / f"proposal-{i}.md"
+            repo.add_note(
+                prop_path,
+                Note(
+                    path=prop_path,
+                    frontmatter=Frontmatter.model_validate({"librarian": "file"}),
+                    body=f"%%FILE: 20. Projects/Foo/bar.md%%\n---\ntitle: {title}\n---\nBody",
+                ),
+            )
+
+        service = FilerService(
+            repo,
+            review_dir=str(review_dir),
+            vault_root=Path("/vault"),
+        )
+
+        assert service.file_approved_notes() == 2
+        assert repo.get_note(Path("20. Projects/Foo/bar.md")).frontmatter.title == "First"
+        assert repo.get_note(Path("20. Projects/Foo/bar-1.md")).frontmatter.title == "Second"
+
+    def test_large_queue_files_only_approved_proposals(self) -> None:
+        review_dir = Path("00. Inbox/1. Review Queue")
+        repo = MockVaultAdapter()
+        for i in range(20):
+            prop_path = review_dir / f"proposal-{i:02d}.md"
+            repo.add_note(
+                prop_path,
+                Note(
+                    path=prop_path,
+                    frontmatter=Frontmatter.model_validate(
+                        {"librarian": "file" if i % 2 == 0 else "review"}
+                    ),
+                    body=f"%%FILE: 20. Projects/Foo/note-{i}.md%%\n---\ntitle: N{i}\n---\nBody",
+                ),
+            )
+
+        service = FilerService(
+            repo,
+            review_dir=str(review_dir),
+            vault_root=Path("/vault"),
+        )
+
+        assert service.file_approved_notes() == 10
+        assert len(repo.list_note_paths_in(review_dir)) == 10
+        assert repo.get_note(Path("20. Projects/Foo/note-4.md")) is not None
+        assert repo.get_note(Path("20. Projects/Foo/note-5.md")) is None
+
     def test_path_traversal_skipped(self) -> None:
         review_dir = Path("00. Inbox/1. Review Queue")
         prop_path = review_dir / "malicious.md"
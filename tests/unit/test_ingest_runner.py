@@ -11,7 +11,7 @@ from src_v2.entrypoints.ingest_runner import main
 class TestIngestRunner:
     """Tests for ingest_runner.main()."""
 
-    @patch("src_v2.entrypoints.ingest_runner.GeminiAdapter")
+    @patch("src_v2.infrastructure.llm.adapters.GeminiAdapter")
     @patch("src_v2.entrypoints.ingest_runner.ObsidianFileSystemAdapter")
     @patch("src_v2.entrypoints.ingest_runner.Settings")
     def test_main_returns_zero_on_success(
@@ -26,6 +26,11 @@ class TestIngestRunner:
         mock_settings.review_dir = "00. Inbox/1. Review Queue"
         mock_settings.capture_dir = "00. Inbox/0. Capture"
         mock_settings.log_level = "INFO"
+        mock_settings.llm_cache_path = ""
+        mock_settings.llm_cache_ttl = 0
+        mock_settings.llm_context_cache_ttl = 0
+        mock_settings.ingest_batch_size = 1
+        mock_settings.ingest_workers = 4
         mock_settings_cls.return_value = mock_settings
 
         mock_repo = MagicMock()
@@ -49,7 +54,7 @@ class TestIngestRunner:
         mock_filer.file_approved_notes.assert_called_once()
         mock_ingest.run.assert_called_once()
 
-    @patch("src_v2.entrypoints.ingest_runner.GeminiAdapter")
+    @patch("src_v2.infrastructure.llm.adapters.GeminiAdapter")
     @patch("src_v2.entrypoints.ingest_runner.ObsidianFileSystemAdapter")
     @patch("src_v2.entrypoints.ingest_runner.Settings")
     def test_main_returns_zero_when_empty_capture(
@@ -64,9 +69,15 @@ class TestIngestRunner:
         mock_settings.review_dir = "00. Inbox/1. Review Queue"
         mock_settings.capture_dir = "00. Inbox/0. Capture"
         mock_settings.log_level = "INFO"
+        mock_settings.llm_cache_path = ""
+        mock_settings.llm_cache_ttl = 0
+        mock_settings.llm_context_cache_ttl = 0
+        mock_settings.ingest_batch_size = 1
+        mock_settings.ingest_workers = 4
         mock_settings_cls.return_value = mock_settings
 
         mock_repo = MagicMock()
+        mock_repo.list_note_paths_in.return_value = []
         mock_adapter_cls.return_value = mock_repo
 
         with patch("src_v2.entrypoints.ingest_runner.FilerService") as mock_filer_cls:
@@ -84,8 +95,11 @@ class TestIngestRunner:
                 exit_code = main()
 
         assert exit_code == 0
+        mock_filer.file_approved_notes.assert_called_once()
+        mock_gemini_cls.assert_not_called()
+        mock_ingest.run.assert_not_called()
 
-    @patch("src_v2.entrypoints.ingest_runner.GeminiAdapter")
+    @patch("src_v2.infrastructure.llm.adapters.GeminiAdapter")
     @patch("src_v2.entrypoints.ingest_runner.Settings")
     def test_main_returns_one_when_gemini_api_key_missing(
         self,
@@ -96,6 +110,11 @@ class TestIngestRunner:
         mock_settings.vault_root = Path("/tmp/vault")
         mock_settings.gemini_api_key = ""
         mock_settings.log_level = "INFO"
+        mock_settings.llm_cache_path = ""
+        mock_settings.llm_cache_ttl = 0
+        mock_settings.llm_context_cache_ttl = 0
+        mock_settings.ingest_batch_size = 1
+        mock_settings.ingest_workers = 4
         mock_settings_cls.return_value = mock_settings
 
         mock_gemini_cls.side_effect = ValueError("GEMINI_API_KEY not set")
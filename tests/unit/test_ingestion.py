@@ -1,5 +1,6 @@
 """Unit tests for IngestionService."""
 
+import threading
 from pathlib import Path
 
 import pytest
@@ -82,6 +83,126 @@ class TestIngestionService:
         assert result.processed_count == 0
         assert repo.read_raw(capture_path) is not None
 
+    def test_failure_stops_in_capture_order(self, fake_llm: FakeLLM) -> None:
+        capture_dir = Path("00. Inbox/0. Capture")
+        repo = MockVaultAdapter()
+        for name in ("a.md", "b.md", "c.md"):
+            repo.set_raw_content(capture_dir / name, f"content {name}")
+
+        class FailOnB(FakeLLM):
+            def generate_proposal(self, instructions, body, context, skeleton):
+                if "b.md" in body:
+                    raise RuntimeError("API error")
+                return super().generate_proposal(instructions, body, context, skeleton)
+
+        service = IngestionService(
+            repo,
+            FailOnB(),
+            capture_dir=str(capture_dir),
+            review_dir="00. Inbox/1. Review Queue",
+            vault_root=Path("/vault"),
+        )
+        result = service.run()
+
+        assert result == IngestionResult(processed_count=1, success=False)
+        assert repo.read_raw(capture_dir / "a.md") is None
+        assert repo.read_raw(capture_dir / "b.md") is not None
+        assert repo.read_raw(capture_dir / "c.md") is not None
+
+    def test_batches_captures_into_shared_requests(self, fake_llm: FakeLLM) -> None:
+        capture_dir = Path("00. Inbox/0. Capture")
+        repo = MockVaultAdapter()
+        for name in ("a.md", "b.md", "c.md"):
+            repo.set_raw_content(capture_dir / name, f"content {name}")
+
+        batches: list[int] = []
+
+        class BatchingLLM(FakeLLM):
+            def generate_proposals(self, items, context, skeleton):
+                batches.append(len(items))
+                return super().generate_proposals(items, context, skeleton)
+
+        service = IngestionService(
+            repo,
+            BatchingLLM(),
+            capture_dir=str(capture_dir),
+            review_dir="00. Inbox/1. Review Queue",
+            vault_root=Path("/vault"),
+            batch_size=2,
+        )
+        result = service.run()
+
+        assert result == IngestionResult(processed_count=3, success=True)
+        assert batches == [2]
+        assert repo.list_note_paths_in(capture_dir) == []
+
+    def test_same_proposal_name_gets_suffix(self, fake_llm: FakeLLM) -> None:
+        capture_dir = Path("00. Inbox/0. Capture")
+        review_dir = Path("00. Inbox/1. Review Queue")
+        repo = MockVaultAdapter()
+        repo.set_raw_content(capture_dir / "a.md", "first")
+        repo.set_raw_content(capture_dir / "b.md", "second")
+
+        service = IngestionService(
+            repo,
+            fake_llm,
+            capture_dir=str(capture_dir),
+            review_dir=str(review_dir),
+            vault_root=Path("/vault"),
+        )
+        service.run()
+
+        assert "first" in repo.files[review_dir / "proposal.md"].body
+        assert "second" in repo.files[review_dir / "proposal-1.md"].body
+
+    def test_folders_to_create_deduplicated_in_order(self, fake_llm: FakeLLM) -> None:
+        capture_dir = Path("00. Inbox/0. Capture")
+        review_dir = Path("00. Inbox/1. Review Queue")
+        repo = MockVaultAdapter()
+        repo.set_raw_content(capture_dir / "a.md", "first")
+        fake_llm.generate_proposal = lambda **kwargs: (
+            "%%FILE: 20. Projects/B/one.md%%\nx\n"
+            "%%FILE: 20. Projects/A/two.md%%\ny\n"
+            "%%FILE: 20. Projects/B/three.md%%\nz\n"
+            "%%FILE: top.md%%\nw\n"
+        )
+
+        service = IngestionService(
+            repo,
+            fake_llm,
+            capture_dir=str(capture_dir),
+            review_dir=str(review_dir),
+            vault_root=Path("/vault"),
+        )
+        service.run()
+
+        fm = repo.files[review_dir / "one.md"].frontmatter.model_dump(by_alias=True)
+        assert fm["folders-to-create"] == ["20. Projects/B", "20. Projects/A", "."]
+
+    def test_llm_calls_overlap_up_to_worker_count(self, fake_llm: FakeLLM) -> None:
+        capture_dir = Path("00. Inbox/0. Capture")
+        repo = MockVaultAdapter()
+        for name in ("a.md", "b.md"):
+            repo.set_raw_content(capture_dir / name, f"content {name}")
+
+        # Each call waits for the other, so this only completes if both run at once.
+        barrier = threading.Barrier(2, timeout=5)
+
+        class RendezvousLLM(FakeLLM):
+            def generate_proposal(self, instructions, body, context, skeleton):
+                barrier.wait()
+                return super().generate_proposal(instructions, body, context, skeleton)
+
+        service = IngestionService(
+            repo,
+            RendezvousLLM(),
+            capture_dir=str(capture_dir),
+            review_dir="00. Inbox/1. Review Queue",
+            vault_root=Path("/vault"),
+            workers=2,
+        )
+        assert service.run() == IngestionResult(processed_count=2, success=True)
+
     def test_extracts_llm_instructions_block(self, fake_llm: FakeLLM) -> None:
         capture_dir = Path("00. Inbox/0. Capture")
         capture_path = capture_dir / "with_instructions.md"
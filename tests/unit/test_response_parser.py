@@ -2,7 +2,7 @@
 
 import pytest
 
-from src_v2.core.response_parser import parse_proposal
+from src_v2.core.response_parser import parse_proposal, split_batch_response
 
 
 class TestParseProposal:
@@ -70,3 +70,22 @@ also good"""
         assert len(result["files"]) == 2
         assert result["files"][0]["path"] == "valid.md"
         assert result["files"][1]["path"] == "also_valid.md"
+
+
+class TestSplitBatchResponse:
+    """Tests for split_batch_response()."""
+
+    def test_splits_items_by_marker(self) -> None:
+        text = """%%BATCH_ITEM: 1%%
+%%FILE: a.md%%
+first
+%%BATCH_ITEM: 2%%
+%%FILE: b.md%%
+second"""
+        first, second = split_batch_response(text, 2)
+        assert parse_proposal(first)["files"][0]["path"] == "a.md"
+        assert parse_proposal(second)["files"][0]["content"] == "second"
+
+    def test_missing_and_duplicate_items_are_none(self) -> None:
+        text = "%%BATCH_ITEM: 1%%\none\n%%BATCH_ITEM: 2%%\ntwo\n%%BATCH_ITEM: 2%%\nagain"
+        assert split_batch_response(text, 3) == ["one", None, None]
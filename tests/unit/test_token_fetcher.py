@@ -0,0 +1,105 @@
+"""Unit tests for scripts/token_fetcher.py."""
+
+import json
+from unittest.mock import patch
+
+import pytest
+import requests
+
+from scripts import token_fetcher
+
+API_URL = "https://api.github.com/repos/owner/repo/actions/runners/registration-token"
+
+
+def _response(status_code: int, body: dict | None = None, headers: dict | None = None) -> requests.Response:
+    """Build a requests.Response with a JSON body."""
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = json.dumps(body or {}).encode()
+    response.headers.update(headers or {})
+    return response
+
+
+@pytest.fixture
+def mock_post():
+    """Patch the shared session's post so no request leaves the process."""
+    with patch.object(token_fetcher._SESSION, "post") as post:
+        yield post
+
+
+@pytest.fixture
+def mock_sleep():
+    """Patch time.sleep so retries run instantly."""
+    with patch("scripts.token_fetcher.time.sleep") as sleep:
+        yield sleep
+
+
+class TestPostWithRetry:
+    """Tests for _post_with_retry."""
+
+    def test_429_waits_for_retry_after(self, mock_post, mock_sleep) -> None:
+        mock_post.side_effect = [_response(429, headers={"Retry-After": "7"}), _response(201)]
+        response = token_fetcher._post_with_retry(API_URL, {})
+        assert response.status_code == 201
+        assert mock_post.call_count == 2
+        mock_sleep.assert_called_once_with(7.0)
+
+    def test_503_is_retried_until_it_succeeds(self, mock_post, mock_sleep) -> None:
+        mock_post.side_effect = [_response(503), _response(503), _response(201)]
+        response = token_fetcher._post_with_retry(API_URL, {})
+        assert response.status_code == 201
+        assert mock_post.call_count == 3
+        assert mock_sleep.call_count == 2
+
+    def test_connection_errors_exhaust_retries(self, mock_post, mock_sleep) -> None:
+        mock_post.side_effect = requests.exceptions.ConnectionError("reset")
+        with pytest.raises(requests.exceptions.ConnectionError):
+            token_fetcher._post_with_retry(API_URL, {})
+        assert mock_post.call_count == token_fetcher.MAX_RETRIES + 1
+        assert mock_sleep.call_count == token_fetcher.MAX_RETRIES
+
+    @pytest.mark.parametrize("status_code", [401, 404])
+    def test_client_errors_are_returned_without_retry(self, mock_post, mock_sleep, status_code: int) -> None:
+        mock_post.return_value = _response(status_code)
+        response = token_fetcher._post_with_retry(API_URL, {})
+        assert response.status_code == status_code
+        assert mock_post.call_count == 1
+        mock_sleep.assert_not_called()
+
+
+class TestAuthSchemeCache:
+    """Tests for remembering the Authorization scheme that works for a PAT."""
+
+    REPO_URL = "https://github.com/owner/repo"
+
+    @pytest.fixture(autouse=True)
+    def _clear_scheme_cache(self):
+        token_fetcher._AUTH_SCHEME_CACHE.clear()
+        yield
+        token_fetcher._AUTH_SCHEME_CACHE.clear()
+
+    @staticmethod
+    def _schemes(mock_post) -> list[str]:
+        return [c.kwargs["headers"]["Authorization"].split()[0] for c in mock_post.call_args_list]
+
+    def test_falls_back_to_bearer_and_remembers_it(self, mock_post, mock_sleep) -> None:
+        mock_post.side_effect = [_response(403), _response(201, {"token": "t1"}), _response(201, {"token": "t2"})]
+        assert token_fetcher.get_registration_token(self.REPO_URL, "pat") == "t1"
+        assert token_fetcher.get_registration_token(self.REPO_URL, "pat") == "t2"
+        assert self._schemes(mock_post) == ["token", "Bearer", "Bearer"]
+        assert token_fetcher._AUTH_SCHEME_CACHE[token_fetcher._pat_key("pat")] == "Bearer"
+
+    def test_403_clears_remembered_scheme_and_tries_the_other(self, mock_post, mock_sleep) -> None:
+        token_fetcher._AUTH_SCHEME_CACHE[token_fetcher._pat_key("pat")] = "Bearer"
+        mock_post.side_effect = [_response(403), _response(201, {"token": "t1"})]
+        assert token_fetcher.get_registration_token(self.REPO_URL, "pat") == "t1"
+        assert self._schemes(mock_post) == ["Bearer", "token"]
+        assert token_fetcher._AUTH_SCHEME_CACHE[token_fetcher._pat_key("pat")] == "token"
+
+    def test_scheme_is_forgotten_when_both_are_forbidden(self, mock_post, mock_sleep) -> None:
+        token_fetcher._AUTH_SCHEME_CACHE[token_fetcher._pat_key("pat")] = "Bearer"
+        mock_post.return_value = _response(403, {"message": "Forbidden"})
+        with pytest.raises(requests.HTTPError, match="Forbidden"):
+            token_fetcher.get_registration_token(self.REPO_URL, "pat")
+        assert self._schemes(mock_post) == ["Bearer", "token"]
+        assert token_fetcher._pat_key("pat") not in token_fetcher._AUTH_SCHEME_CACHE
@@ -0,0 +1,102 @@
+"""Unit tests for vault_utils helpers."""
+
+from pathlib import Path
+
+from src_v2.core.domain.models import Frontmatter, Note
+from src_v2.core.vault_utils import (
+    get_safe_path,
+    load_post,
+    note_from_raw_content,
+    note_to_raw_content,
+    sanitize_filename,
+    strip_frontmatter,
+)
+
+
+class TestSanitizeFilename:
+    """Tests for sanitize_filename."""
+
+    def test_collapses_unsafe_runs_to_single_dash(self) -> None:
+        assert sanitize_filename("Q3 plan: budget / draft_v2 (final)?") == "Q3-plan-budget-draft-v2-(final)"
+
+    def test_keeps_unicode_letters_and_falls_back_when_empty(self) -> None:
+        assert sanitize_filename("Café résumé") == "Café-résumé"
+        assert sanitize_filename(" /?_ ") == "untitled"
+
+    def test_truncates_without_trailing_dash(self) -> None:
+        assert sanitize_filename("abc def", max_length=4) == "abc"
+
+
+class TestGetSafePath:
+    """Tests for get_safe_path collision handling."""
+
+    def test_returns_target_when_free(self, tmp_path: Path) -> None:
+        target = tmp_path / "note.md"
+        assert get_safe_path(target) == target
+
+    def test_picks_first_free_suffix(self, tmp_path: Path) -> None:
+        for name in ("note.md", "note-1.md", "note-3.md"):
+            (tmp_path / name).write_text("", encoding="utf-8")
+        assert get_safe_path(tmp_path / "note.md") == tmp_path / "note-2.md"
+
+    def test_skips_reserved_paths(self, tmp_path: Path) -> None:
+        (tmp_path / "note.md").write_text("", encoding="utf-8")
+        reserved = {tmp_path / "note-1.md"}
+        assert get_safe_path(tmp_path / "note.md", reserved) == tmp_path / "note-2.md"
+
+    def test_reserved_target_in_missing_directory(self, tmp_path: Path) -> None:
+        target = tmp_path / "missing" / "note.md"
+        assert get_safe_path(target, {target}) == tmp_path / "missing" / "note-1.md"
+
+    def test_listings_answer_probes_without_disk(self, tmp_path: Path) -> None:
+        listings: dict[Path, set[str]] = {}
+        assert get_safe_path(tmp_path / "note.md", listings=listings) == tmp_path / "note.md"
+        assert listings == {tmp_path: set()}
+        listings[tmp_path].update({"note.md", "note-1.md"})
+        assert get_safe_path(tmp_path / "note.md", listings=listings) == tmp_path / "note-2.md"
+
+    def test_next_suffix_resumes_after_last_allocation(self, tmp_path: Path) -> None:
+        (tmp_path / "note.md").write_text("", encoding="utf-8")
+        target = tmp_path / "note.md"
+        listings: dict[Path, set[str]] = {}
+        next_suffix: dict[Path, int] = {}
+        allocated = []
+        for _ in range(3):
+            path = get_safe_path(target, listings=listings, next_suffix=next_suffix)
+            listings[tmp_path].add(path.name)
+            allocated.append(path.name)
+        assert allocated == ["note-1.md", "note-2.md", "note-3.md"]
+        assert next_suffix == {target: 4}
+
+
+class TestNoteRawContent:
+    """Tests for note_to_raw_content / note_from_raw_content."""
+
+    def test_roundtrip_preserves_frontmatter_and_body(self) -> None:
+        note = Note(
+            path=Path("a.md"),
+            frontmatter=Frontmatter(title="A", tags=["x"]),
+            body="Body text",
+        )
+        raw = note_to_raw_content(note)
+        assert raw.startswith("---\n")
+        loaded = note_from_raw_content(Path("a.md"), raw)
+        assert loaded.frontmatter.title == "A"
+        assert loaded.frontmatter.tags == ["x"]
+        assert loaded.body == "Body text"
+
+    def test_load_post_only_treats_leading_fence_as_frontmatter(self) -> None:
+        post = load_post("---\ntitle: A\n---\nBody")
+        assert post.metadata == {"title": "A"}
+        assert post.content == "Body"
+        plain = load_post("Intro\n---\ntitle: B\n---\n")
+        assert plain.metadata == {}
+        assert plain.content.startswith("Intro")
+
+    def test_strip_frontmatter_matches_parsed_body(self) -> None:
+        for raw in (
+            "---\nlibrarian: file\n---\n%%FILE: a.md%%\n---\nx: 1\n---\nBody\n",
+            "\n\nNo frontmatter\n---\nhere\n",
+            "---\nopen: only\n",
+        ):
+            assert strip_frontmatter(raw) == load_post(raw).content